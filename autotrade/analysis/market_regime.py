@@ -14,6 +14,8 @@ from enum import Enum
 import numpy as np
 import pandas as pd
 
+from autotrade.utils.fast_ma import sma
+
 _LOG = logging.getLogger(__name__)
 
 
@@ -106,20 +108,23 @@ class MarketRegimeDetector:
         if len(prices) < 200:
             raise ValueError("Need at least 200 days of price data for regime detection")
 
+        # Work on one contiguous array: every value below is the last point
+        # of a rolling mean, so trailing-window means and the O(N) cumsum
+        # kernel replace full pandas rolling passes.
+        values = prices.to_numpy(dtype=np.float64)
+
         # Calculate indicators - ensure scalar float values
-        sma_50 = float(prices.rolling(window=50).mean().iloc[-1])
-        sma_200 = float(prices.rolling(window=200).mean().iloc[-1])
+        sma_50 = float(values[-50:].mean())
+        sma_200 = float(values[-200:].mean())
 
         # Calculate ATR (Average True Range)
-        high = prices.rolling(window=1).max()  # Simplified - use actual high if available
-        low = prices.rolling(window=1).min()  # Simplified - use actual low if available
-        atr = self._calculate_atr(prices, high, low, period=14)
+        atr = self._calculate_atr(values, period=14)
 
         # Calculate ADX (Average Directional Index)
-        adx = self._calculate_adx(prices, period=14)
+        adx = self._calculate_adx(values, period=14)
 
         # Determine trend direction
-        current_price = float(prices.iloc[-1])
+        current_price = float(values[-1])
         trend_direction = self._classify_trend_direction(current_price, sma_50, sma_200)
 
         # Determine trend strength
@@ -213,31 +218,27 @@ class MarketRegimeDetector:
 
     def _calculate_atr(
         self,
-        close: pd.Series,
-        high: pd.Series,
-        low: pd.Series,
+        values: np.ndarray,
         period: int = 14,
     ) -> float:
         """
         Calculate Average True Range.
 
-        Simplified version using close prices if high/low not available.
+        Simplified version using close prices; only the last window matters,
+        so this is a single trailing mean of absolute close-to-close moves.
         """
-        # Calculate true range (simplified using close-to-close changes)
-        tr = close.diff().abs()
-
-        # Calculate ATR as moving average of true range
-        atr = tr.rolling(window=period).mean().iloc[-1]
+        tr = np.abs(np.diff(values[-(period + 1):]))
+        atr = tr.mean()
 
         # Return default if calculation fails
-        if pd.isna(atr) or np.isinf(atr):
-            return float(close.iloc[-1] * 0.01)  # Default to 1% of price
+        if not np.isfinite(atr):
+            return float(values[-1] * 0.01)  # Default to 1% of price
 
         return float(atr)
 
     def _calculate_adx(
         self,
-        prices: pd.Series,
+        values: np.ndarray,
         period: int = 14,
     ) -> float:
         """
@@ -247,36 +248,37 @@ class MarketRegimeDetector:
         ADX measures trend strength (0-100):
         - > 25: Strong trend
         - < 20: Weak/no trend
+
+        The smoothed components come from the cumsum SMA kernel, so the
+        whole computation is O(N) in the series length.
         """
         # Calculate directional movement
-        delta = prices.diff()
-
-        # Positive and negative directional movement
-        plus_dm = delta.clip(lower=0)
-        minus_dm = (-delta).clip(lower=0)
-
-        # Smooth with moving average
-        plus_dm_smooth = plus_dm.rolling(window=period).mean()
-        minus_dm_smooth = minus_dm.rolling(window=period).mean()
-
-        # Calculate directional indicators
-        atr = prices.diff().abs().rolling(window=period).mean()
-
-        # Avoid division by zero
-        plus_di = 100 * (plus_dm_smooth / atr.replace(0, np.nan))
-        minus_di = 100 * (minus_dm_smooth / atr.replace(0, np.nan))
-
-        # Calculate DX (Directional Index)
-        # Avoid division by zero in denominator
-        di_sum = plus_di + minus_di
-        di_diff = (plus_di - minus_di).abs()
-        dx = 100 * (di_diff / di_sum.replace(0, np.nan))
-
-        # ADX is smoothed DX
-        adx = dx.rolling(window=period).mean().iloc[-1]
+        delta = np.diff(values)
+
+        # Positive and negative directional movement, smoothed
+        plus_dm_smooth = sma(np.clip(delta, 0.0, None), period)
+        minus_dm_smooth = sma(np.clip(-delta, 0.0, None), period)
+        atr = sma(np.abs(delta), period)
+
+        # Directional indicators; zero ATR windows become NaN rather than
+        # dividing by zero
+        with np.errstate(divide="ignore", invalid="ignore"):
+            atr_safe = np.where(atr == 0.0, np.nan, atr)
+            plus_di = 100 * (plus_dm_smooth / atr_safe)
+            minus_di = 100 * (minus_dm_smooth / atr_safe)
+
+            # Calculate DX (Directional Index)
+            di_sum = plus_di + minus_di
+            di_diff = np.abs(plus_di - minus_di)
+            dx = 100 * (di_diff / np.where(di_sum == 0.0, np.nan, di_sum))
+
+        # ADX is smoothed DX; only the last window is needed
+        if dx.size < period:
+            return 20.0
+        adx = dx[-period:].mean()
 
         # Return default if calculation fails (NaN or inf)
-        if pd.isna(adx) or np.isinf(adx):
+        if not np.isfinite(adx):
             return 20.0
 
         return float(adx)
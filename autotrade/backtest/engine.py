@@ -6,6 +6,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from autotrade.backtest.metrics import PerformanceMetrics
@@ -176,6 +177,14 @@ class BacktestEngine:
             if pos.is_open
         )
 
+    def get_position(self, ticker: str) -> Position | None:
+        """Return the tracked position for a ticker, or None if none exists.
+
+        Public accessor so callers (e.g. the backtest runner) do not
+        reach into the internal positions table.
+        """
+        return self._positions.get(ticker)
+
     def can_open_position(self) -> bool:
         """Check if we can open a new position."""
         open_positions = sum(1 for pos in self._positions.values() if pos.is_open)
@@ -344,6 +353,44 @@ class BacktestEngine:
 
         return portfolio_value
 
+    def update_equity_bulk(
+        self,
+        timestamps: pd.DatetimeIndex,
+        cash: np.ndarray,
+        close_matrix: np.ndarray,
+        position_matrix: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Compute the whole equity curve and daily returns in one pass.
+
+        Replaces per-date update_equity/calculate_daily_return calls for
+        callers that already hold the full price and position history:
+        mark-to-market becomes a single elementwise multiply-and-sum
+        instead of one dict-driven Python sweep per trading day.
+
+        Args:
+            timestamps: One timestamp per row
+            cash: Cash balance per row
+            close_matrix: (dates, tickers) mark prices; rows where a
+                position is held must not contain NaN (forward-fill first)
+            position_matrix: (dates, tickers) held share counts
+
+        Returns:
+            Array of portfolio values, one per row
+        """
+        values = np.asarray(cash, dtype=np.float64) + np.nansum(
+            position_matrix * close_matrix, axis=1
+        )
+
+        self._equity_history = list(zip(timestamps, values.tolist()))
+
+        prev = values[:-1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            returns = np.where(prev != 0, (values[1:] - prev) / prev, 0.0)
+        self._daily_returns = returns.tolist()
+
+        return values
+
     def calculate_daily_return(self) -> float:
         """Calculate daily return from last two equity points."""
         if len(self._equity_history) < 2:
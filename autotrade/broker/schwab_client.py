@@ -4,7 +4,7 @@ from __future__ import annotations
 from contextlib import AbstractContextManager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Sequence
 
 import httpx
 import logging
@@ -74,6 +74,25 @@ class SchwabClient(AbstractContextManager["SchwabClient"]):
             raise ValueError(f"No quote price returned for {ticker}")
         return price
 
+    def get_last_trade_prices(self, tickers: Sequence[str]) -> dict[str, float]:
+        """Fetch last-trade prices for several tickers in one quote call.
+
+        Schwab's quote endpoint accepts a symbol list, so this costs a single
+        HTTPS round trip regardless of watchlist size. Tickers with no usable
+        price in the response are omitted from the result.
+        """
+        symbols = [ticker.upper() for ticker in tickers]
+        if not symbols:
+            return {}
+        response = self._require_client().get_quotes(symbols)
+        payload = self._as_json(response, context=f"quotes for {', '.join(symbols)}")
+        prices: dict[str, float] = {}
+        for ticker in tickers:
+            price = self._extract_price_from_quote(payload, ticker)
+            if price is not None:
+                prices[ticker] = price
+        return prices
+
     def get_historical_quotes(self, ticker: str, *, span: str = "day", interval: str = "5minute") -> list[dict[str, Any]]:
         params = self._resolve_price_history_params(span, interval)
         history_response = self._require_client().get_price_history(
@@ -141,6 +160,25 @@ class SchwabClient(AbstractContextManager["SchwabClient"]):
             order_builder = equities.equity_sell_market(ticker.upper(), order_quantity)
         return self._require_client().place_order(self._account_hash_required(), order_builder)
 
+    def submit_market_orders(self, orders: Sequence[tuple[str, int, str]]) -> list[Any]:
+        """Submit several market orders in one call.
+
+        The Schwab Trader API has no batch-order endpoint, so each leg is
+        still one POST; they are issued back-to-back over the pooled
+        authenticated connection so only the first pays connection setup.
+        Returns the per-order responses in input order. A failed leg is
+        recorded as the raised exception in its slot rather than aborting
+        the remaining orders.
+        """
+        responses: list[Any] = []
+        for ticker, quantity, side in orders:
+            try:
+                responses.append(self.submit_market_order(ticker, quantity=quantity, side=side))
+            except Exception as exc:
+                _LOG.error("Batch order leg failed: %s %s x%s - %s", side, ticker, quantity, exc)
+                responses.append(exc)
+        return responses
+
     def get_portfolio_profile(self) -> dict[str, Any]:
         try:
             account = self._fetch_account()
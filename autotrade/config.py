@@ -133,6 +133,9 @@ class BotConfig:
     trading_window: TradingWindow
     polling_interval_seconds: int
     circuit_breaker: CircuitBreakerConfig = CircuitBreakerConfig()
+    # Drop repeat signals for the same ticker arriving within this window.
+    # 0 disables debouncing; each signal costs a full broker round-trip.
+    signal_min_interval_seconds: float = 0.0
 
     @classmethod
     def default(cls, *, strategy: str = "trend_following", capital: float = 10_000.0) -> "BotConfig":
@@ -1,14 +1,19 @@
 """Market data utilities for driving strategies."""
 from __future__ import annotations
 
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Sequence
 
 import pandas as pd
 
 from autotrade.broker import SchwabClient
 from autotrade.data.history_store import HistoryStore
 
+_LOG = logging.getLogger(__name__)
+
 
 @dataclass(slots=True)
 class Quote:
@@ -19,15 +24,37 @@ class Quote:
 
 @dataclass
 class MarketData:
-    """Market data container for OHLCV data."""
+    """Market data container for OHLCV data.
+
+    Fields are positional sequences; plain lists and numpy arrays are both
+    accepted, and consumers should index rather than rely on truthiness.
+    """
 
     ticker: str
-    date: list[datetime]
-    open_price: list[float]
-    high_price: list[float]
-    low_price: list[float]
-    close_price: list[float]
-    volume: list[int]
+    date: Sequence[datetime]
+    open_price: Sequence[float]
+    high_price: Sequence[float]
+    low_price: Sequence[float]
+    close_price: Sequence[float]
+    volume: Sequence[int]
+
+    @classmethod
+    def from_dataframe(cls, ticker: str, frame: pd.DataFrame) -> MarketData:
+        """Wrap a lowercase-column OHLCV frame without materializing lists.
+
+        ``.tolist()`` allocates one Python float per cell across five
+        columns; the ndarray views returned here are plain buffer handles,
+        and downstream pandas/numpy consumers read them directly.
+        """
+        return cls(
+            ticker=ticker,
+            date=frame.index.to_numpy(),
+            open_price=frame["open"].to_numpy(),
+            high_price=frame["high"].to_numpy(),
+            low_price=frame["low"].to_numpy(),
+            close_price=frame["close"].to_numpy(),
+            volume=frame["volume"].to_numpy(),
+        )
 
 
 class MarketDataService:
@@ -39,6 +66,43 @@ class MarketDataService:
         price = self._client.get_last_trade_price(ticker)
         return Quote(ticker=ticker, price=price, as_of=self._client.now())
 
+    def latest_quotes(self, tickers: Sequence[str]) -> dict[str, Quote]:
+        """Fetch quotes for several tickers with a single broker round trip.
+
+        Clients without a batched quote endpoint fall back to per-ticker
+        fetches overlapped in a thread pool, so tick latency stays roughly
+        one round trip either way. Tickers with no usable price are absent
+        from the map.
+        """
+        fetch_many = getattr(self._client, "get_last_trade_prices", None)
+        if fetch_many is not None:
+            prices = fetch_many(tickers)
+        else:
+            prices = self._fetch_prices_concurrently(tickers)
+        as_of = self._client.now()
+        return {
+            ticker: Quote(ticker=ticker, price=price, as_of=as_of)
+            for ticker, price in prices.items()
+        }
+
+    def _fetch_prices_concurrently(self, tickers: Sequence[str]) -> dict[str, float]:
+        """Overlap per-ticker price round trips; one ticker failing is logged
+        and skipped rather than poisoning the rest of the batch."""
+        prices: dict[str, float] = {}
+        if not tickers:
+            return prices
+        with ThreadPoolExecutor(max_workers=len(tickers)) as pool:
+            futures = {
+                ticker: pool.submit(self._client.get_last_trade_price, ticker)
+                for ticker in tickers
+            }
+            for ticker, future in futures.items():
+                try:
+                    prices[ticker] = future.result()
+                except Exception as exc:
+                    _LOG.warning("Failed to fetch quote for %s: %s", ticker, exc)
+        return prices
+
     def historical_dataframe(self, ticker: str, span: str = "day", interval: str = "5minute") -> pd.DataFrame:
         records = self._client.get_historical_quotes(ticker, span=span, interval=interval)
         if not records:
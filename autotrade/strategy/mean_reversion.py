@@ -12,6 +12,7 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass
 
+import numpy as np
 import pandas as pd
 
 from autotrade.analysis.market_regime import (
@@ -139,7 +140,87 @@ class MeanReversionStrategy(Strategy):
         # Calculate indicators
         indicators = self.calculate_indicators(ticker, data)
 
-        price = data.close_price[-1]
+        return self._signals_from_indicators(ticker, data.close_price[-1], indicators)
+
+    def generate_signals_batch(
+        self,
+        data_by_ticker: dict[str, MarketData],
+        regime: MarketRegime | None = None,
+    ) -> dict[str, list[Signal]]:
+        """Generate mean reversion signals for many tickers at once."""
+        if regime and not self.is_compatible_with_regime(regime):
+            _LOG.debug(
+                "Regime not compatible (%s) - skipping mean reversion batch",
+                regime,
+            )
+            return {ticker: [] for ticker in data_by_ticker}
+
+        indicators_by_ticker = self.calculate_indicators_batch(data_by_ticker)
+        return {
+            ticker: self._signals_from_indicators(
+                ticker,
+                data_by_ticker[ticker].close_price[-1],
+                indicators,
+            )
+            for ticker, indicators in indicators_by_ticker.items()
+        }
+
+    def calculate_indicators_batch(
+        self,
+        data_by_ticker: dict[str, MarketData],
+    ) -> dict[str, dict]:
+        """Calculate Bollinger Bands and RSI for all tickers column-wise.
+
+        One wide frame (one column per ticker) lets pandas run each rolling
+        window across every ticker in a single vectorized pass instead of
+        building a fresh single-column frame per ticker. Columns are aligned
+        on the last bar (index -1) so differing history lengths simply leave
+        NaN at the head, matching the single-ticker warm-up behaviour.
+        """
+        closes = pd.DataFrame(
+            {
+                ticker: pd.Series(
+                    data.close_price,
+                    index=range(-len(data.close_price), 0),
+                )
+                for ticker, data in data_by_ticker.items()
+            }
+        )
+
+        sma = closes.rolling(window=self.params.lookback_period).mean()
+        std = closes.rolling(window=self.params.lookback_period).std()
+        upper_band = sma + (self.params.num_std * std)
+        lower_band = sma - (self.params.num_std * std)
+        rsi = self._calculate_rsi(closes, self.params.rsi_period)
+
+        last_sma = sma.iloc[-1]
+        last_upper = upper_band.iloc[-1]
+        last_lower = lower_band.iloc[-1]
+        last_rsi = rsi.iloc[-1]
+
+        indicators_by_ticker: dict[str, dict] = {}
+        for ticker, data in data_by_ticker.items():
+            indicators = {
+                "sma": last_sma[ticker],
+                "upper_band": last_upper[ticker],
+                "lower_band": last_lower[ticker],
+                "rsi": last_rsi[ticker],
+                "volume": data.volume[-1] if len(data.volume) else 0,
+            }
+            self._indicators[ticker] = indicators
+            indicators_by_ticker[ticker] = indicators
+
+        return indicators_by_ticker
+
+    def _signals_from_indicators(
+        self,
+        ticker: str,
+        price: float,
+        indicators: dict,
+    ) -> list[Signal]:
+        """Emit entry signals for one ticker from its latest indicators."""
+        signals: list[Signal] = []
+
         upper_band = indicators["upper_band"]
         lower_band = indicators["lower_band"]
         sma = indicators["sma"]
@@ -249,6 +330,44 @@ class MeanReversionStrategy(Strategy):
 
         return False, None
 
+    def check_exit_conditions_batch(
+        self,
+        positions: list[dict],
+    ) -> list[tuple[bool, str | None]]:
+        """Check exits for all of this strategy's positions in one pass.
+
+        The scalar rules become array comparisons: signed P&L percentage,
+        return-to-mean against the cached SMA, then profit target and stop
+        loss, with the same precedence as :meth:`check_exit_conditions`.
+        Positions whose SMA is unknown never exit, matching the scalar path.
+        """
+        entry = np.array([p["entry_price"] for p in positions], dtype=np.float64)
+        current = np.array([p["current_price"] for p in positions], dtype=np.float64)
+        is_long = np.array([p["direction"] == "long" for p in positions])
+
+        sma_values = []
+        for position in positions:
+            sma = self._indicators.get(position["ticker"], {}).get("sma")
+            sma_values.append(np.nan if sma is None else sma)
+        sma = np.array(sma_values, dtype=np.float64)
+
+        signed = np.where(is_long, 1.0, -1.0)
+        pnl_pct = (current - entry) / entry * 100.0 * signed
+
+        has_sma = ~np.isnan(sma)
+        returned = np.where(is_long, current >= sma, current <= sma) & has_sma
+        profit = pnl_pct >= self.params.profit_target_pct
+        stop = pnl_pct <= -self.params.stop_loss_pct
+
+        reason = np.select(
+            [returned, profit, stop],
+            ["return_to_mean", "profit_target", "stop_loss"],
+            default="",
+        )
+        reason = np.where(has_sma, reason, "")
+
+        return [(bool(r), r or None) for r in reason.tolist()]
+
     def _calculate_rsi(self, prices: pd.Series, period: int = 14) -> pd.Series:
         """Calculate Relative Strength Index."""
         delta = prices.diff()
@@ -5,6 +5,9 @@ Manages multiple strategies and activates them based on market conditions.
 from __future__ import annotations
 
 import logging
+import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -148,6 +151,103 @@ class StrategyManager:
 
         return all_signals
 
+    def generate_signals_batch(
+        self,
+        data_by_ticker: dict[str, MarketData],
+    ) -> dict[str, list[Signal]]:
+        """
+        Generate signals for a whole batch of tickers in one call.
+
+        Strategies that implement ``generate_signals_batch`` compute their
+        indicators across all tickers at once (column-wise rolling ops
+        instead of one small frame per ticker); the rest fall back to the
+        per-ticker path transparently.
+
+        Args:
+            data_by_ticker: Market data keyed by ticker
+
+        Returns:
+            Dict of ticker -> signals from all active strategies
+        """
+        all_signals: dict[str, list[Signal]] = {ticker: [] for ticker in data_by_ticker}
+
+        for name, allocation in self._strategies.items():
+            if not allocation.is_active:
+                continue
+
+            batch = getattr(allocation.strategy, "generate_signals_batch", None)
+            if batch is not None:
+                try:
+                    per_ticker = batch(data_by_ticker, regime=self._current_regime)
+                except Exception as e:
+                    _LOG.error(
+                        "Error generating batch signals from strategy '%s': %s",
+                        name,
+                        e,
+                    )
+                    continue
+            else:
+                per_ticker = self._generate_signals_fallback(allocation, data_by_ticker)
+
+            produced = 0
+            for ticker, signals in per_ticker.items():
+                if signals:
+                    produced += len(signals)
+                    all_signals[ticker].extend(signals)
+
+            if produced:
+                allocation.signals_today += produced
+                allocation.last_signal_time = datetime.now()
+                _LOG.info(
+                    "Generated %d signals from strategy '%s' across %d tickers",
+                    produced,
+                    name,
+                    len(data_by_ticker),
+                )
+
+        return all_signals
+
+    def _generate_signals_fallback(
+        self,
+        allocation: StrategyAllocation,
+        data_by_ticker: dict[str, MarketData],
+    ) -> dict[str, list[Signal]]:
+        """Per-ticker signal path for strategies without a batch method.
+
+        Tickers fan out across a thread pool: the heavy part of each call is
+        pandas rolling math, which drops the GIL in its native loops, so
+        overlapping the calls recovers most of the multi-core win without
+        pickling strategy state into worker processes. Staying in-process
+        also preserves the indicator caches strategies update as a side
+        effect, which the exit checks read later.
+        """
+        strategy = allocation.strategy
+        regime = self._current_regime
+
+        def _one(item: tuple[str, MarketData]) -> tuple[str, list[Signal]]:
+            ticker, data = item
+            try:
+                return ticker, strategy.generate_signals(
+                    ticker=ticker,
+                    data=data,
+                    regime=regime,
+                )
+            except Exception as e:
+                _LOG.error(
+                    "Error generating signals from strategy '%s' for %s: %s",
+                    strategy.name,
+                    ticker,
+                    e,
+                )
+                return ticker, []
+
+        if len(data_by_ticker) <= 1:
+            return dict(map(_one, data_by_ticker.items()))
+
+        workers = min(len(data_by_ticker), os.cpu_count() or 4)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return dict(pool.map(_one, data_by_ticker.items()))
+
     def check_exit_conditions(
         self,
         ticker: str,
@@ -193,6 +293,65 @@ class StrategyManager:
             )
             return False, None
 
+    def check_exit_conditions_batch(
+        self,
+        positions: list[dict],
+    ) -> list[tuple[bool, str | None]]:
+        """
+        Check exit conditions for many positions in one call.
+
+        Positions are grouped by strategy so a strategy that implements
+        ``check_exit_conditions_batch`` evaluates its whole slice with
+        vectorized comparisons; the rest fall back to the scalar check.
+
+        Args:
+            positions: Dicts with ticker, strategy_name, entry_price,
+                current_price, direction, and days_held keys
+
+        Returns:
+            One (should_exit, exit_reason) tuple per position, in order
+        """
+        results: list[tuple[bool, str | None]] = [(False, None)] * len(positions)
+
+        by_strategy: dict[str, list[int]] = defaultdict(list)
+        for index, position in enumerate(positions):
+            by_strategy[position["strategy_name"]].append(index)
+
+        for name, indices in by_strategy.items():
+            allocation = self._strategies.get(name)
+            if not allocation:
+                _LOG.warning("Unknown strategy '%s' for exit check", name)
+                continue
+
+            strategy_slice = [positions[i] for i in indices]
+            batch = getattr(allocation.strategy, "check_exit_conditions_batch", None)
+            try:
+                if batch is not None:
+                    outcomes = batch(strategy_slice)
+                else:
+                    outcomes = [
+                        allocation.strategy.check_exit_conditions(
+                            ticker=position["ticker"],
+                            entry_price=position["entry_price"],
+                            current_price=position["current_price"],
+                            direction=position["direction"],
+                            days_held=position["days_held"],
+                        )
+                        for position in strategy_slice
+                    ]
+            except Exception as e:
+                _LOG.error(
+                    "Error checking batch exit conditions (strategy=%s): %s",
+                    name,
+                    e,
+                )
+                continue
+
+            for index, outcome in zip(indices, outcomes):
+                results[index] = outcome
+
+        return results
+
     def get_active_strategies(self) -> list[str]:
         """Get list of active strategy names."""
         return [
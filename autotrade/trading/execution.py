@@ -2,12 +2,13 @@
 from __future__ import annotations
 
 import logging
+import sys
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from typing import Any, Protocol
 
-from autotrade.broker import SchwabClient
 from autotrade.config import BotConfig
 from autotrade.strategy.base import Signal
 from autotrade.trading.circuit_breaker import CircuitBreaker
@@ -16,6 +17,27 @@ from autotrade.utils.time_utils import now_utc
 
 _LOG = logging.getLogger(__name__)
 
+_VALID_SIDES = frozenset({"buy", "sell", "flat"})
+
+
+class BrokerProtocol(Protocol):
+    """Broker surface the execution engine needs.
+
+    Keeps a single ExecutionEngine/run_trading_loop implementation usable
+    with any client exposing these calls instead of maintaining per-broker
+    copies of the engine.
+    """
+
+    def get_portfolio_profile(self) -> dict[str, Any]: ...
+
+    def get_positions(self) -> dict[str, dict[str, Any]]: ...
+
+    def get_last_trade_price(self, ticker: str) -> float: ...
+
+    def submit_market_order(self, ticker: str, quantity: float, *, side: str) -> Any: ...
+
+    def get_order_status(self, order_id: str) -> dict[str, Any] | None: ...
+
 
 class OrderStatus(Enum):
     """Order status states."""
@@ -49,13 +71,46 @@ class PositionLimits:
 @dataclass(slots=True)
 class HeldPosition:
     quantity: float = 0.0
-    avg_cost: float = 0.0
+    total_cost: float = 0.0
+
+    @property
+    def avg_cost(self) -> float:
+        """Average cost per share, derived lazily from the running total.
+
+        Storing the running total keeps the buy path to a single add;
+        the divide only happens on read (P&L and logging paths).
+        """
+        return self.total_cost / self.quantity if self.quantity else 0.0
+
+
+# Shared read-only stand-in for a closed-out position; avoids allocating a
+# fresh HeldPosition each time a sell flattens the ticker.
+_FLAT_POSITION = HeldPosition()
 
 
 class ExecutionEngine:
+    __slots__ = (
+        "_client",
+        "_config",
+        "_paper",
+        "_trade_logger",
+        "_positions",
+        "_orders",
+        "_pending_order_ids",
+        "_min_signal_interval",
+        "_last_signal_ts",
+        "_dispatch",
+        "_limits",
+        "_cached_exposure",
+        "_cached_cash",
+        "_projected_delta",
+        "_cb_enabled",
+        "_circuit_breaker",
+    )
+
     def __init__(
         self,
-        client: SchwabClient,
+        client: BrokerProtocol,
         config: BotConfig,
         *,
         paper_trading: bool = False,
@@ -67,9 +122,34 @@ class ExecutionEngine:
         self._trade_logger = trade_logger
         self._positions: dict[str, HeldPosition] = {}
         self._orders: dict[str, OrderRecord] = {}  # Track submitted orders
+        self._pending_order_ids: set[str] = set()  # Orders still in SUBMITTED status
+        self._min_signal_interval = config.signal_min_interval_seconds
+        self._last_signal_ts: dict[str, float] = {}
+        # Limits are immutable config; build once instead of per signal.
+        self._limits = PositionLimits(
+            max_position_size=config.strategy.max_position_size,
+            max_total_exposure=config.strategy.max_total_exposure,
+        )
+        # Intern the static ticker set so hot dict lookups on _positions hit
+        # the identity fast path instead of hashing/comparing characters.
+        for ticker in config.strategy.tickers:
+            sys.intern(ticker)
+        # Per-tick portfolio snapshot pushed in by the trading loop; while
+        # one is set, buys skip the get_portfolio_profile round trip.
+        self._cached_exposure: float | None = None
+        self._cached_cash = 0.0
+        self._projected_delta = 0.0
+        # Side-specialized handlers; keeps each code path small and avoids
+        # the monolithic branch chain in handle_signal.
+        self._dispatch = {
+            "buy": self._handle_buy,
+            "sell": self._handle_sell,
+            "flat": self._handle_flat,
+        }
 
         # Initialize circuit breaker for risk management
         cb_config = config.circuit_breaker
+        self._cb_enabled = cb_config.enabled
         self._circuit_breaker = CircuitBreaker(
             max_daily_loss=cb_config.max_daily_loss,
             max_consecutive_losses=cb_config.max_consecutive_losses,
@@ -79,6 +159,21 @@ class ExecutionEngine:
 
         self._reconcile_positions()
 
+    def set_portfolio_snapshot(self, profile: dict[str, Any] | None) -> None:
+        """Install the loop's per-tick portfolio snapshot.
+
+        Pass ``None`` (e.g. after a failed fetch) to invalidate the cache;
+        handle_signal then falls back to querying the broker directly.
+        Fills within the tick accumulate into a projected delta so several
+        buys in one tick stay within budget without a refetch.
+        """
+        if profile is None:
+            self._cached_exposure = None
+            return
+        self._cached_exposure = float(profile.get("market_value", 0.0) or 0.0)
+        self._cached_cash = float(profile.get("cash_available_for_trading", 0.0) or 0.0)
+        self._projected_delta = 0.0
+
     def _reconcile_positions(self) -> None:
         """Load current positions from broker to reconcile internal state.
 
@@ -109,9 +204,9 @@ class ExecutionEngine:
                 cost_float = float(avg_cost)
 
                 if qty_float > 0:
-                    self._positions[ticker] = HeldPosition(
+                    self._positions[sys.intern(ticker)] = HeldPosition(
                         quantity=qty_float,
-                        avg_cost=cost_float,
+                        total_cost=qty_float * cost_float,
                     )
                     reconciled_count += 1
                     _LOG.info(
@@ -127,13 +222,45 @@ class ExecutionEngine:
             _LOG.error("Position reconciliation failed: %s", exc, exc_info=True)
             # Don't raise - allow bot to continue but log error for investigation
 
-    def handle_signal(self, signal: Signal) -> None:
-        if signal.side not in {"buy", "sell", "flat"}:
-            _LOG.debug("Ignoring unsupported signal side %s", signal.side)
+    def handle_signal(
+        self,
+        signal: Signal,
+        *,
+        price: float | None = None,
+        holdings: dict[str, dict[str, Any]] | None = None,
+        now: datetime | None = None,
+    ) -> None:
+        """Translate a strategy signal into an order.
+
+        ``price`` and ``holdings`` may be injected by the trading loop from
+        its per-tick batched snapshot; when omitted they are fetched from the
+        broker, costing one round trip each. ``now`` lets the loop stamp all
+        fills in a tick with the same timestamp instead of one clock read
+        per signal.
+        """
+        if signal.side not in _VALID_SIDES:
+            if _LOG.isEnabledFor(logging.DEBUG):
+                _LOG.debug("Ignoring unsupported signal side %s", signal.side)
             return
 
-        # Check circuit breaker before executing any trades
-        if not self._circuit_breaker.can_trade():
+        # Debounce fast-repeating signals per ticker so duplicates within the
+        # configured window do not each trigger a full broker round-trip.
+        if self._min_signal_interval > 0.0:
+            now_mono = time.monotonic()
+            last = self._last_signal_ts.get(signal.ticker)
+            if last is not None and now_mono - last < self._min_signal_interval:
+                _LOG.debug(
+                    "Coalescing %s %s signal within %.2fs debounce window",
+                    signal.side,
+                    signal.ticker,
+                    self._min_signal_interval,
+                )
+                return
+            self._last_signal_ts[signal.ticker] = now_mono
+
+        # Check circuit breaker before executing any trades; skip the call
+        # entirely when the breaker is disabled in config.
+        if self._cb_enabled and not self._circuit_breaker.can_trade():
             _LOG.warning(
                 "Circuit breaker prevents trading: %s (signal=%s %s)",
                 self._circuit_breaker.trip_reason(),
@@ -141,95 +268,150 @@ class ExecutionEngine:
                 signal.ticker,
             )
             return
-        limits = PositionLimits(
-            max_position_size=self._config.strategy.max_position_size,
-            max_total_exposure=self._config.strategy.max_total_exposure,
-        )
-        price = self._client.get_last_trade_price(signal.ticker)
+        limits = self._limits
+        if price is None:
+            price = self._client.get_last_trade_price(signal.ticker)
         if price <= 0:
             _LOG.info("Skipping %s order; invalid price %.2f", signal.ticker, price)
             return
-        portfolio = self._client.get_portfolio_profile()
-        total_exposure = float(portfolio.get("market_value", 0.0) or 0.0)
-        cash_available = float(portfolio.get("cash_available_for_trading", 0.0) or 0.0)
-        holdings = self._client.get_positions()
+        if self._cached_exposure is not None:
+            total_exposure = self._cached_exposure + self._projected_delta
+            cash_available = self._cached_cash - self._projected_delta
+        else:
+            portfolio = self._client.get_portfolio_profile()
+            total_exposure = float(portfolio.get("market_value", 0.0) or 0.0)
+            cash_available = float(portfolio.get("cash_available_for_trading", 0.0) or 0.0)
+        if holdings is None:
+            holdings = self._client.get_positions()
         current_shares = self._current_shares(holdings, signal.ticker)
         tracked = self._positions.get(signal.ticker)
         tracked_shares = tracked.quantity if tracked else 0.0
-        timestamp = now_utc()
+        timestamp = now if now is not None else now_utc()
 
-        if signal.side == "flat":
-            quantity_to_sell = int(max(current_shares, tracked_shares))
-            if quantity_to_sell <= 0:
-                return
-            reason, metadata = "flatten", {}
-            if self._submit(signal.ticker, quantity_to_sell, "sell", price, reason=reason, metadata=metadata):
-                realized, position = self._update_after_sell(signal.ticker, quantity_to_sell, price)
-                self._log_trade(
-                    ticker=signal.ticker,
-                    side="sell",
-                    quantity=quantity_to_sell,
-                    price=price,
-                    timestamp=timestamp,
-                    reason=reason,
-                    metadata=metadata,
-                    realized_pnl=realized,
-                    position=position,
-                )
-                # Record trade outcome with circuit breaker
-                self._circuit_breaker.record_trade(signal.ticker, realized)
+        handler = self._dispatch[signal.side]
+        handler(
+            signal,
+            price=price,
+            timestamp=timestamp,
+            limits=limits,
+            total_exposure=total_exposure,
+            cash_available=cash_available,
+            current_shares=current_shares,
+            tracked_shares=tracked_shares,
+        )
+
+    def _handle_flat(
+        self,
+        signal: Signal,
+        *,
+        price: float,
+        timestamp: datetime,
+        limits: PositionLimits,
+        total_exposure: float,
+        cash_available: float,
+        current_shares: float,
+        tracked_shares: float,
+    ) -> None:
+        quantity_to_sell = int(max(current_shares, tracked_shares))
+        if quantity_to_sell <= 0:
             return
+        reason, metadata = "flatten", {}
+        if self._submit(signal.ticker, quantity_to_sell, "sell", price, reason=reason, metadata=metadata):
+            realized = self._update_after_sell(signal.ticker, quantity_to_sell, price)
+            position = self._positions.get(signal.ticker, _FLAT_POSITION)
+            self._log_trade(
+                ticker=signal.ticker,
+                side="sell",
+                quantity=quantity_to_sell,
+                price=price,
+                timestamp=timestamp,
+                reason=reason,
+                metadata=metadata,
+                realized_pnl=realized,
+                position=position,
+            )
+            # Record trade outcome with circuit breaker
+            if self._cb_enabled:
+                self._circuit_breaker.record_trade(signal.ticker, realized)
 
-        if signal.side == "buy":
-            quantity = self._resolve_buy_quantity(
-                signal, price, limits.max_position_size, cash_available
+    def _handle_buy(
+        self,
+        signal: Signal,
+        *,
+        price: float,
+        timestamp: datetime,
+        limits: PositionLimits,
+        total_exposure: float,
+        cash_available: float,
+        current_shares: float,
+        tracked_shares: float,
+    ) -> None:
+        quantity = self._resolve_buy_quantity(
+            signal, price, limits.max_position_size, cash_available
+        )
+        if quantity <= 0:
+            _LOG.info(
+                "Skipping %s buy; insufficient cash (available %.2f, price %.2f)",
+                signal.ticker,
+                cash_available,
+                price,
             )
-            if quantity <= 0:
-                _LOG.info(
-                    "Skipping %s buy; insufficient cash (available %.2f, price %.2f)",
-                    signal.ticker,
-                    cash_available,
-                    price,
-                )
-                return
-            projected = total_exposure + price * quantity
-            if projected > limits.max_total_exposure:
-                _LOG.info(
-                    "Skipping %s buy; projected exposure %.2f exceeds limit %.2f",
-                    signal.ticker,
-                    projected,
-                    limits.max_total_exposure,
-                )
-                return
-            reason, metadata = self._extract_reason_and_metadata(signal.metadata, default="entry")
-            if self._submit(signal.ticker, quantity, "buy", price, reason=reason, metadata=metadata):
-                position = self._update_after_buy(signal.ticker, quantity, price)
-                self._log_trade(
-                    ticker=signal.ticker,
-                    side="buy",
-                    quantity=quantity,
-                    price=price,
-                    timestamp=timestamp,
-                    reason=reason,
-                    metadata=metadata,
-                    realized_pnl=0.0,
-                    position=position,
-                )
             return
+        projected = total_exposure + price * quantity
+        if projected > limits.max_total_exposure:
+            _LOG.info(
+                "Skipping %s buy; projected exposure %.2f exceeds limit %.2f",
+                signal.ticker,
+                projected,
+                limits.max_total_exposure,
+            )
+            return
+        reason, metadata = self._extract_reason_and_metadata(signal.metadata, default="entry")
+        if self._submit(signal.ticker, quantity, "buy", price, reason=reason, metadata=metadata):
+            self._projected_delta += price * quantity
+            position = self._update_after_buy(signal.ticker, quantity, price)
+            self._log_trade(
+                ticker=signal.ticker,
+                side="buy",
+                quantity=quantity,
+                price=price,
+                timestamp=timestamp,
+                reason=reason,
+                metadata=metadata,
+                realized_pnl=0.0,
+                position=position,
+            )
 
-        if current_shares <= 0:
-            if tracked_shares <= 0:
+    def _handle_sell(
+        self,
+        signal: Signal,
+        *,
+        price: float,
+        timestamp: datetime,
+        limits: PositionLimits,
+        total_exposure: float,
+        cash_available: float,
+        current_shares: float,
+        tracked_shares: float,
+    ) -> None:
+        # Coerce to whole shares once and reuse; avoids the repeated
+        # int()/max() calls the previous formulation did per sell.
+        cur_i = int(current_shares)
+        trk_i = int(tracked_shares)
+        if cur_i <= 0:
+            if trk_i <= 0:
                 _LOG.info("Skipping %s sell; no exposure", signal.ticker)
                 return
-            current_shares = tracked_shares
-        target_quantity = signal.quantity if signal.quantity else current_shares
-        available = max(current_shares, tracked_shares)
-        quantity = min(int(target_quantity), int(available))
+            cur_i = trk_i
+        avail_i = cur_i if cur_i >= trk_i else trk_i
+        target_i = int(signal.quantity) if signal.quantity else cur_i
+        quantity = target_i if target_i <= avail_i else avail_i
         if quantity <= 0:
             return
         reason, metadata = self._extract_reason_and_metadata(signal.metadata, default="exit")
         if self._submit(signal.ticker, quantity, "sell", price, reason=reason, metadata=metadata):
-            realized, position = self._update_after_sell(signal.ticker, quantity, price)
+            realized = self._update_after_sell(signal.ticker, quantity, price)
+            position = self._positions.get(signal.ticker, _FLAT_POSITION)
             self._log_trade(
                 ticker=signal.ticker,
                 side="sell",
@@ -242,7 +424,8 @@ class ExecutionEngine:
                 position=position,
             )
             # Record trade outcome with circuit breaker
-            self._circuit_breaker.record_trade(signal.ticker, realized)
+            if self._cb_enabled:
+                self._circuit_breaker.record_trade(signal.ticker, realized)
 
     def _resolve_buy_quantity(
         self,
@@ -251,15 +434,16 @@ class ExecutionEngine:
         max_position_size: float,
         cash_available: float,
     ) -> int:
-        if signal.quantity and signal.quantity > 0:
-            target = int(signal.quantity)
+        signal_quantity = signal.quantity
+        if signal_quantity and signal_quantity > 0:
+            target = int(signal_quantity)
             affordable = int(cash_available // price) if price > 0 else 0
             if affordable <= 0:
                 return 0
             return min(target, affordable)
-        notional = max_position_size
-        if signal.metadata and "notional" in signal.metadata:
-            notional = float(signal.metadata["notional"])
+        metadata = signal.metadata
+        notional_val = metadata.get("notional") if metadata else None
+        notional = float(notional_val) if notional_val is not None else max_position_size
         notional = min(notional, cash_available)
         if notional < price:
             return 0
@@ -375,6 +559,8 @@ class ExecutionEngine:
             else:
                 _LOG.debug("Unknown order status '%s' for order %s", status_str, order_id)
 
+            if order_record.status != OrderStatus.SUBMITTED:
+                self._pending_order_ids.discard(order_id)
             return order_record.status
 
         except Exception as exc:
@@ -387,11 +573,9 @@ class ExecutionEngine:
         Returns:
             List of OrderRecord objects with SUBMITTED status
         """
-        return [
-            order
-            for order in self._orders.values()
-            if order.status == OrderStatus.SUBMITTED
-        ]
+        # The pending-id set is maintained on submission and status change,
+        # so this avoids scanning the full order history every call.
+        return [self._orders[order_id] for order_id in self._pending_order_ids]
 
     def get_circuit_breaker_status(self) -> dict[str, any]:
         """Get current circuit breaker status.
@@ -425,15 +609,18 @@ class ExecutionEngine:
         timestamp = now_utc()
 
         if self._paper:
-            _LOG.info(
-                "Paper trade: %s %s x%s @ %.2f (reason=%s, metadata=%s)",
-                side,
-                ticker,
-                quantity,
-                price,
-                reason,
-                metadata,
-            )
+            # Guarded: formatting the metadata dict is wasted work when INFO
+            # is disabled, and this fires on every simulated fill.
+            if _LOG.isEnabledFor(logging.INFO):
+                _LOG.info(
+                    "Paper trade: %s %s x%s @ %.2f (reason=%s, metadata=%s)",
+                    side,
+                    ticker,
+                    quantity,
+                    price,
+                    reason,
+                    metadata,
+                )
             # Track paper orders with synthetic ID
             order_id = f"PAPER_{ticker}_{timestamp.strftime('%Y%m%d_%H%M%S')}"
             order = OrderRecord(
@@ -469,6 +656,7 @@ class ExecutionEngine:
 
             if order_id:
                 self._orders[order_id] = order
+                self._pending_order_ids.add(order_id)
                 _LOG.info(
                     "Submitted %s order: %s x%s @ %.2f (order_id=%s, reason=%s)",
                     side,
@@ -525,26 +713,37 @@ class ExecutionEngine:
             return False
 
     def _update_after_buy(self, ticker: str, quantity: int, price: float) -> HeldPosition:
-        position = self._positions.get(ticker, HeldPosition())
-        total_cost = position.avg_cost * position.quantity + price * quantity
+        position = self._positions.get(ticker)
+        if position is None:
+            position = HeldPosition()
+            self._positions[sys.intern(ticker)] = position
+        position.total_cost += price * quantity
         position.quantity += quantity
-        position.avg_cost = total_cost / position.quantity if position.quantity else 0.0
-        self._positions[ticker] = position
         return position
 
-    def _update_after_sell(self, ticker: str, quantity: int, price: float) -> tuple[float, HeldPosition]:
-        position = self._positions.get(ticker, HeldPosition())
+    def _update_after_sell(self, ticker: str, quantity: int, price: float) -> float:
+        """Apply a sell to the tracked position and return realized P&L.
+
+        Returns only the scalar so the hot path skips a tuple allocation;
+        callers that need the remaining position re-read ``_positions``
+        (falling back to the shared flat sentinel once it is closed out).
+        """
+        position = self._positions.get(ticker)
+        if position is None:
+            return 0.0
         sell_qty = min(quantity, position.quantity) if position.quantity else 0.0
-        realized = (price - position.avg_cost) * sell_qty if sell_qty else 0.0
+        if sell_qty:
+            avg_cost = position.total_cost / position.quantity
+            realized = (price - avg_cost) * sell_qty
+            position.total_cost -= avg_cost * sell_qty
+        else:
+            realized = 0.0
         position.quantity -= sell_qty
         if position.quantity <= 0:
             position.quantity = 0.0
-            position.avg_cost = 0.0
-            if ticker in self._positions:
-                self._positions.pop(ticker)
-        else:
-            self._positions[ticker] = position
-        return realized, position
+            position.total_cost = 0.0
+            self._positions.pop(ticker, None)
+        return realized
 
     def _log_trade(
         self,
@@ -589,6 +788,10 @@ class ExecutionEngine:
             return payload, {}
         if isinstance(payload, dict):
             reason_value = payload.get("reason", default)
+            # Metadata reasons are almost always strings already; skip the
+            # redundant str() cast on that fast path.
+            if type(reason_value) is str:
+                return reason_value, payload
             return str(reason_value), payload
         return default, {}
 
@@ -596,7 +799,7 @@ class ExecutionEngine:
 class TradeExecutor:
     """Simplified trade executor for multi-strategy bot."""
 
-    def __init__(self, broker: SchwabClient | None, circuit_breaker: CircuitBreaker, dry_run: bool = True):
+    def __init__(self, broker: BrokerProtocol | None, circuit_breaker: CircuitBreaker, dry_run: bool = True):
         """
         Initialize trade executor.
 
@@ -3,10 +3,11 @@ from __future__ import annotations
 
 import logging
 import signal
+import threading
 import time
 from contextlib import contextmanager
 from datetime import datetime
-from typing import Callable, Iterator
+from typing import Iterator
 
 from autotrade.broker import SchwabClient
 from autotrade.config import BotConfig
@@ -22,22 +23,31 @@ import httpx
 
 _LOG = logging.getLogger(__name__)
 
+# Hoisted exception groups for the per-tick try/except ladders.
+_API_EXC = (httpx.HTTPError, RuntimeError)
+_DATA_EXC = (ValueError, TypeError, KeyError)
+
 
 @contextmanager
-def graceful_shutdown() -> Iterator[Callable[[], bool]]:
-    terminate = False
+def graceful_shutdown() -> Iterator[threading.Event]:
+    """Install SIGINT/SIGTERM handlers that set the yielded stop event.
+
+    Yielding an Event (rather than a polling callable) lets the loop park
+    in ``event.wait(timeout)`` and wake the moment a signal lands instead
+    of finishing out a full polling interval.
+    """
+    stop_event = threading.Event()
 
     def _handler(signum, frame):  # pragma: no cover - signal handling
-        nonlocal terminate
         _LOG.info("Received signal %s, shutting down", signum)
-        terminate = True
+        stop_event.set()
 
     original_int = signal.getsignal(signal.SIGINT)
     original_term = signal.getsignal(signal.SIGTERM)
     signal.signal(signal.SIGINT, _handler)
     signal.signal(signal.SIGTERM, _handler)
     try:
-        yield lambda: terminate
+        yield stop_event
     finally:
         signal.signal(signal.SIGINT, original_int)
         signal.signal(signal.SIGTERM, original_term)
@@ -46,14 +56,14 @@ def graceful_shutdown() -> Iterator[Callable[[], bool]]:
 def run_trading_loop(client: SchwabClient, config: BotConfig, *, paper_trading: bool = False) -> None:
     # Validate market hours before starting
     market_status = get_market_status()
-    if not market_status["is_open"]:
+    if not market_status.is_open:
         _LOG.warning(
             "Market is currently closed (weekend=%s, holiday=%s). "
             "Next market open: %s (in %.1f hours)",
-            market_status["is_weekend"],
-            market_status["is_holiday"],
-            market_status["next_open"].strftime("%Y-%m-%d %H:%M %Z"),
-            market_status["seconds_until_open"] / 3600,
+            market_status.is_weekend,
+            market_status.is_holiday,
+            market_status.next_open.strftime("%Y-%m-%d %H:%M %Z"),
+            market_status.seconds_until_open / 3600,
         )
         if not paper_trading:
             _LOG.error("Cannot start live trading when market is closed. Exiting.")
@@ -65,20 +75,30 @@ def run_trading_loop(client: SchwabClient, config: BotConfig, *, paper_trading:
     trade_logger = TradeLogger()
     execution = ExecutionEngine(client, config, paper_trading=paper_trading, trade_logger=trade_logger)
     polling_seconds = config.polling_interval_seconds
+    # Bind per-tick config reads to locals; LOAD_FAST beats the attribute
+    # chains the hot loop would otherwise re-resolve every iteration.
+    tickers = tuple(config.strategy.tickers)
+    market_close = config.trading_window.market_close
+    # Compare seconds-since-midnight as plain ints; now.time() would
+    # allocate a time object per tick just to feed time.__ge__.
+    close_sec = market_close.hour * 3600 + market_close.minute * 60 + market_close.second
     mode = "paper" if paper_trading else "live"
-    _LOG.info("Starting %s trading loop for %s", mode, config.strategy.tickers)
+    _LOG.info("Starting %s trading loop for %s", mode, tickers)
     _LOG.info("Market status: Regular hours=%s, Extended hours=%s",
-              market_status["is_regular_hours"],
-              market_status["is_extended_hours"])
+              market_status.is_regular_hours,
+              market_status.is_extended_hours)
     reporter = DailySummaryReporter(config)
     exit_reason = "market_closed"
     portfolio_error_logged = False
-    with graceful_shutdown() as should_stop:
+    with graceful_shutdown() as stop_event:
+        # Monotonic deadline keeps the tick cadence fixed regardless of how
+        # long each tick's work takes; plain sleep(polling) would drift.
+        deadline = time.monotonic()
         while True:
             now = now_utc()
             try:
                 portfolio_snapshot = client.get_portfolio_profile()
-            except (httpx.HTTPError, RuntimeError) as exc:
+            except _API_EXC as exc:
                 # API/network errors when fetching portfolio
                 if not portfolio_error_logged:
                     _LOG.warning("Failed to fetch portfolio profile (API error): %s", exc)
@@ -93,6 +113,9 @@ def run_trading_loop(client: SchwabClient, config: BotConfig, *, paper_trading:
             else:
                 portfolio_error_logged = False
                 reporter.record_portfolio(timestamp=now, profile=portfolio_snapshot)
+            # Push the snapshot (or invalidate on failure) so handle_signal
+            # can skip its own portfolio round trip this tick.
+            execution.set_portfolio_snapshot(portfolio_snapshot or None)
 
             # Check if market is still open (validates holidays, weekends, and regular hours)
             if not is_market_open(now, allow_extended_hours=False):
@@ -101,43 +124,101 @@ def run_trading_loop(client: SchwabClient, config: BotConfig, *, paper_trading:
                 break
 
             # Also check configured trading window
-            if now.time() >= config.trading_window.market_close:
+            if now.hour * 3600 + now.minute * 60 + now.second >= close_sec:
                 _LOG.info("Trading window closed (configured time reached), exiting loop")
                 exit_reason = "trading_window_closed"
                 break
+            # Batched per-tick snapshot: one multi-symbol quote call and one
+            # positions call replace the N+1 round trips handle_signal would
+            # otherwise issue per ticker.
+            try:
+                quotes = data_service.latest_quotes(tickers)
+            except (*_API_EXC, ValueError) as exc:
+                _LOG.warning("API error fetching batched quotes: %s", exc)
+                for ticker in tickers:
+                    reporter.record_error(ticker=ticker, error=exc, timestamp=now)
+                quotes = {}
+            try:
+                holdings = client.get_positions()
+            except _API_EXC as exc:
+                _LOG.warning("API error fetching positions snapshot: %s", exc)
+                holdings = None
             flattened = False
             if strategy.should_flatten(timestamp=now):
                 diagnostics = strategy.diagnostics(timestamp=now)
                 reporter.record_flatten(timestamp=now, diagnostics=diagnostics)
-                for ticker in config.strategy.tickers:
-                    execution.handle_signal(Signal(ticker=ticker, side="flat"))
+                for ticker in tickers:
+                    quote = quotes.get(ticker)
+                    execution.handle_signal(
+                        Signal(ticker=ticker, side="flat"),
+                        price=quote.price if quote else None,
+                        holdings=holdings,
+                        now=now,
+                    )
                 flattened = True
             if not flattened:
-                for ticker in config.strategy.tickers:
+                # Feed every quote to the strategy first, then snapshot
+                # diagnostics once for the whole tick; computing them per
+                # ticker repeated the same O(N) state walk N times.
+                processed: list[tuple[str, object, Signal | None]] = []
+                for ticker in tickers:
+                    quote = quotes.get(ticker)
+                    if quote is None:
+                        continue
                     try:
-                        quote = data_service.latest_quote(ticker)
                         signal_out = strategy.on_quote(quote, timestamp=now)
-                        diagnostics = strategy.diagnostics(timestamp=now)
-                        reporter.record_quote(quote, diagnostics)
-                        if signal_out:
-                            reporter.record_signal(signal_out, diagnostics, timestamp=now)
-                            execution.handle_signal(signal_out)
-                    except (httpx.HTTPError, RuntimeError) as exc:
+                        processed.append((ticker, quote, signal_out))
+                    except _API_EXC as exc:
                         # API/network errors when fetching quotes
                         reporter.record_error(ticker=ticker, error=exc, timestamp=now)
                         _LOG.warning("API error processing %s: %s", ticker, exc)
-                    except (ValueError, TypeError, KeyError) as exc:
+                    except _DATA_EXC as exc:
                         # Data validation or processing errors
                         reporter.record_error(ticker=ticker, error=exc, timestamp=now)
-                        _LOG.error("Data error processing %s: %s", ticker, exc, exc_info=True)
+                        # Traceback formatting is costly; only attach it when DEBUG is on
+                        _LOG.error("Data error processing %s: %s", ticker, exc,
+                                   exc_info=_LOG.isEnabledFor(logging.DEBUG))
                     except Exception as exc:
                         # Catch-all for unexpected errors - log with full traceback
                         reporter.record_error(ticker=ticker, error=exc, timestamp=now)
                         _LOG.exception("Unexpected error processing %s: %s", ticker, exc)
-            if should_stop():
+                if processed:
+                    diagnostics = strategy.diagnostics(timestamp=now)
+                    for ticker, quote, signal_out in processed:
+                        try:
+                            reporter.record_quote(quote, diagnostics)
+                            if signal_out:
+                                reporter.record_signal(signal_out, diagnostics, timestamp=now)
+                                execution.handle_signal(signal_out, price=quote.price, holdings=holdings, now=now)
+                        except _API_EXC as exc:
+                            reporter.record_error(ticker=ticker, error=exc, timestamp=now)
+                            _LOG.warning("API error processing %s: %s", ticker, exc)
+                        except _DATA_EXC as exc:
+                            reporter.record_error(ticker=ticker, error=exc, timestamp=now)
+                            _LOG.error("Data error processing %s: %s", ticker, exc,
+                                       exc_info=_LOG.isEnabledFor(logging.DEBUG))
+                        except Exception as exc:
+                            reporter.record_error(ticker=ticker, error=exc, timestamp=now)
+                            _LOG.exception("Unexpected error processing %s: %s", ticker, exc)
+            if stop_event.is_set():
+                _LOG.info("Received shutdown request, stopping loop")
+                exit_reason = "shutdown"
+                break
+            deadline += polling_seconds
+            remaining = deadline - time.monotonic()
+            if remaining < -2 * polling_seconds:
+                _LOG.warning(
+                    "Trading loop fell %.1fs behind schedule; resyncing cadence",
+                    -remaining,
+                )
+                deadline = time.monotonic() + polling_seconds
+                remaining = polling_seconds
+            # Event.wait returns immediately on shutdown instead of sleeping
+            # out the remainder of the polling interval.
+            if stop_event.wait(max(0.0, remaining)):
                 _LOG.info("Received shutdown request, stopping loop")
                 exit_reason = "shutdown"
                 break
-            time.sleep(polling_seconds)
+    trade_logger.close()
     summary_text = reporter.finalize(end_time=now_utc(), reason=exit_reason)
     _LOG.info("Daily summary:\n%s", summary_text)
@@ -1,8 +1,13 @@
 """Daily reporting utilities for summarizing trading loop activity."""
 from __future__ import annotations
 
+import io
+import os
+import sys
+from bisect import bisect_left
+from collections import defaultdict
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, time, timedelta
 from pathlib import Path
 from typing import Any
 
@@ -43,6 +48,51 @@ class PortfolioSnapshot:
     cash_withdrawal: float
 
 
+@dataclass(slots=True)
+class TradeEvent:
+    timestamp: datetime
+    ticker: str
+    action: str
+    quantity: int
+    price: float
+    strategy: str
+    pnl: float | None
+
+
+@dataclass(slots=True)
+class SignalEvent:
+    timestamp: datetime
+    ticker: str
+    signal_type: str
+    strategy: str
+    confidence: float
+    executed: bool
+
+
+# Bound .format of a module-level template: the row shape never changes, so
+# per-row work is substitution only, with the zscore thresholds pre-formatted
+# once per report.
+_QUOTE_LINE = (
+    "- {ticker}: price {price} @ {time}, z={z} (entry \u00b1{entry}, exit {exit}); "
+    "sma_fast={sma_fast}, sma_slow={sma_slow}"
+).format
+
+
+def _write_report(path: Path, text: str) -> None:
+    """Write ``text`` to ``path`` in one syscall and fsync it.
+
+    The end-of-day report is the session's only persisted artifact, so it is
+    worth the explicit fsync for crash durability; the single os.write also
+    skips the buffered-IO layer Path.write_text goes through.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, text.encode("utf-8"))
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
 class DailySummaryReporter:
     """Collects intra-day facts and renders a plain-text summary at session end."""
 
@@ -62,6 +112,7 @@ class DailySummaryReporter:
         self._errors: list[ErrorSnapshot] = []
         self._flatten_events: list[datetime] = []
         self._regime_history: list[tuple[datetime, str | None, str | None]] = []
+        self._last_regime_key: tuple[str | None, str | None] | None = None
         self._last_diagnostics: StrategyDiagnostics | None = None
         self._portfolio_history: list[PortfolioSnapshot] = []
 
@@ -139,7 +190,7 @@ class DailySummaryReporter:
 
         summary = "\n".join(line for line in lines if line)
         output_path = self._output_dir / f"{session_date.isoformat()}.txt"
-        output_path.write_text(summary, encoding="utf-8")
+        _write_report(output_path, summary)
         return summary
 
     def _register_start(self, timestamp: datetime) -> None:
@@ -147,17 +198,14 @@ class DailySummaryReporter:
             self._start_time = timestamp
 
     def _update_regime_history(self, diagnostics: StrategyDiagnostics, timestamp: datetime) -> None:
-        regime = diagnostics.regime
-        target = diagnostics.target_ticker
-        if not self._regime_history:
-            self._regime_history.append((timestamp, regime, target))
-            return
-        last_ts, last_regime, last_target = self._regime_history[-1]
-        if regime == last_regime and target == last_target:
+        # Runs on every quote tick; a cached last-seen key makes the common
+        # no-change case one tuple comparison instead of list indexing and
+        # unpacking.
+        key = (diagnostics.regime, diagnostics.target_ticker)
+        if key == self._last_regime_key:
             return
-        if last_ts == timestamp and regime == last_regime and target == last_target:
-            return
-        self._regime_history.append((timestamp, regime, target))
+        self._last_regime_key = key
+        self._regime_history.append((timestamp, *key))
 
     def _format_regime_line(self) -> str:
         if not self._regime_history and not self._last_diagnostics:
@@ -181,20 +229,25 @@ class DailySummaryReporter:
     def _format_quote_lines(self) -> list[str]:
         lines: list[str] = []
         params = self._config.strategy.params
+        entry_str = f"{params.entry_zscore:.2f}"
+        exit_str = f"{params.exit_zscore:.2f}"
         for ticker in self._config.strategy.tickers:
             snapshot = self._quotes.get(ticker)
             if not snapshot:
                 lines.append(f"- {ticker}: no intraday quotes captured")
                 continue
             metrics = snapshot.metrics or {}
-            z_str = self._format_metric(metrics.get("z_score"))
-            sma_fast = self._format_metric(metrics.get("sma_fast"))
-            sma_slow = self._format_metric(metrics.get("sma_slow"))
-            price = f"{snapshot.price:.2f}"
-            time_str = self._format_time(snapshot.as_of)
             lines.append(
-                f"- {ticker}: price {price} @ {time_str}, z={z_str} (entry ±{params.entry_zscore:.2f}, exit {params.exit_zscore:.2f}); "
-                f"sma_fast={sma_fast}, sma_slow={sma_slow}"
+                _QUOTE_LINE(
+                    ticker=ticker,
+                    price=f"{snapshot.price:.2f}",
+                    time=self._format_time(snapshot.as_of),
+                    z=self._format_metric(metrics.get("z_score")),
+                    entry=entry_str,
+                    exit=exit_str,
+                    sma_fast=self._format_metric(metrics.get("sma_fast")),
+                    sma_slow=self._format_metric(metrics.get("sma_slow")),
+                )
             )
         return lines
 
@@ -275,7 +328,9 @@ class DailySummaryReporter:
     def _format_time(ts: datetime | None) -> str:
         if not ts:
             return "n/a"
-        return ts.astimezone().strftime("%H:%M:%S")
+        # Slicing the C-accelerated isoformat() output is markedly faster
+        # than strftime's format-string interpreter for a plain HH:MM:SS.
+        return ts.astimezone().isoformat(timespec="seconds")[11:19]
 
     @staticmethod
     def _format_metric(value: float | None) -> str:
@@ -284,6 +339,10 @@ class DailySummaryReporter:
         return f"{value:.3f}"
 
 
+_RULE = "=" * 80 + "\n"
+_SUB = "-" * 80 + "\n"
+
+
 class PerformanceReporter:
     """Performance reporting for multi-strategy bot."""
 
@@ -293,17 +352,32 @@ class PerformanceReporter:
         Args:
             reports_dir: Directory to save daily reports
         """
-        self._trades = []
+        self._trades: list[TradeEvent] = []
         self._daily_pnl = []
         self._regime_changes = []
-        self._signals_generated = []
+        self._signals_generated: list[SignalEvent] = []
         self._errors = []
+        # Parallel timestamp lists kept sorted by append order so daily
+        # filtering can bisect a day window instead of scanning all history.
+        self._trade_ts: list[datetime] = []
+        self._signal_ts: list[datetime] = []
+        self._regime_ts: list[datetime] = []
+        self._error_ts: list[datetime] = []
+        # Incremental day -> key -> events groupings maintained at record
+        # time so report generation never re-groups the day's records.
+        # defaultdict skips the setdefault lookup-then-insert dance on the
+        # recording hot path; days are keyed by toordinal() ints so recording
+        # never allocates date objects and key hashing is integer hashing.
+        self._trades_by_ticker: defaultdict = defaultdict(lambda: defaultdict(list))
+        self._signals_by_strategy: defaultdict = defaultdict(lambda: defaultdict(list))
+        # Memoized get_summary result, invalidated whenever a trade lands.
+        self._summary_cache: dict | None = None
         self._session_start = None
         self._reports_dir = Path(reports_dir)
         self._reports_dir.mkdir(parents=True, exist_ok=True)
 
     def record_trade(self, ticker: str, action: str, quantity: int, price: float,
-                    strategy: str, pnl: float = None):
+                    strategy: str, pnl: float = None, timestamp: datetime | None = None):
         """Record a completed trade.
 
         Args:
@@ -313,36 +387,52 @@ class PerformanceReporter:
             price: Execution price
             strategy: Strategy name
             pnl: Profit/loss (for exits only)
+            timestamp: Event time; defaults to now. Callers recording several
+                facts for one tick should pass the same cached value.
         """
-        trade = {
-            "ticker": ticker,
-            "action": action,
-            "quantity": quantity,
-            "price": price,
-            "strategy": strategy,
-            "pnl": pnl,
-            "timestamp": datetime.now(),
-        }
+        # Tickers, actions, and strategy names come from small closed sets;
+        # interning collapses the copies held by a long-running session and
+        # makes the grouping-dict hashing an identity comparison.
+        ticker = sys.intern(ticker)
+        action = sys.intern(action)
+        strategy = sys.intern(strategy)
+        trade = TradeEvent(
+            timestamp=timestamp or datetime.now(),
+            ticker=ticker,
+            action=action,
+            quantity=quantity,
+            price=price,
+            strategy=strategy,
+            pnl=pnl,
+        )
         self._trades.append(trade)
+        self._trade_ts.append(trade.timestamp)
+        self._trades_by_ticker[trade.timestamp.toordinal()][ticker].append(trade)
+        self._summary_cache = None
 
         if self._session_start is None:
             self._session_start = datetime.now()
 
-    def record_regime_change(self, regime: str, active_strategies: list[str]):
+    def record_regime_change(self, regime: str, active_strategies: list[str],
+                             timestamp: datetime | None = None):
         """Record a market regime change.
 
         Args:
             regime: Market regime description
             active_strategies: List of activated strategy names
+            timestamp: Event time; defaults to now.
         """
+        now = timestamp or datetime.now()
         self._regime_changes.append({
-            "timestamp": datetime.now(),
-            "regime": regime,
+            "timestamp": now,
+            "regime": sys.intern(regime),
             "active_strategies": active_strategies,
         })
+        self._regime_ts.append(now)
 
     def record_signal(self, ticker: str, signal_type: str, strategy: str,
-                     confidence: float, executed: bool):
+                     confidence: float, executed: bool,
+                     timestamp: datetime | None = None):
         """Record a trading signal.
 
         Args:
@@ -351,34 +441,46 @@ class PerformanceReporter:
             strategy: Strategy that generated signal
             confidence: Signal confidence (0-1)
             executed: Whether signal was executed
+            timestamp: Event time; defaults to now.
         """
-        self._signals_generated.append({
-            "timestamp": datetime.now(),
-            "ticker": ticker,
-            "signal_type": signal_type,
-            "strategy": strategy,
-            "confidence": confidence,
-            "executed": executed,
-        })
+        ticker = sys.intern(ticker)
+        signal_type = sys.intern(signal_type)
+        strategy = sys.intern(strategy)
+        now = timestamp or datetime.now()
+        event = SignalEvent(
+            timestamp=now,
+            ticker=ticker,
+            signal_type=signal_type,
+            strategy=strategy,
+            confidence=confidence,
+            executed=executed,
+        )
+        self._signals_generated.append(event)
+        self._signal_ts.append(now)
+        self._signals_by_strategy[now.toordinal()][strategy].append(event)
 
-    def record_error(self, error: Exception, context: str = ""):
+    def record_error(self, error: Exception, context: str = "",
+                     timestamp: datetime | None = None):
         """Record an error.
 
         Args:
             error: Exception that occurred
             context: Context/description of where error occurred
+            timestamp: Event time; defaults to now.
         """
+        now = timestamp or datetime.now()
         self._errors.append({
-            "timestamp": datetime.now(),
+            "timestamp": now,
             "error": str(error),
             "type": error.__class__.__name__,
             "context": context,
         })
+        self._error_ts.append(now)
 
-    def record_daily_pnl(self, pnl: float):
+    def record_daily_pnl(self, pnl: float, timestamp: datetime | None = None):
         """Record daily profit/loss."""
         self._daily_pnl.append({
-            "date": datetime.now().date(),
+            "date": (timestamp or datetime.now()).date(),
             "pnl": pnl,
         })
 
@@ -390,20 +492,33 @@ class PerformanceReporter:
                 "total_pnl": 0.0,
                 "win_rate": 0.0,
             }
-
-        total_pnl = sum(t["pnl"] for t in self._trades if t["pnl"] is not None)
-        winning_trades = sum(1 for t in self._trades if t["pnl"] and t["pnl"] > 0)
-        completed_trades = sum(1 for t in self._trades if t["pnl"] is not None)
+        if self._summary_cache is not None:
+            return self._summary_cache
+
+        # Single fused pass; the previous three comprehensions each walked
+        # the full all-time trade log.
+        total_pnl = 0.0
+        winning_trades = 0
+        completed_trades = 0
+        for trade in self._trades:
+            pnl = trade.pnl
+            if pnl is None:
+                continue
+            completed_trades += 1
+            total_pnl += pnl
+            if pnl > 0:
+                winning_trades += 1
 
         win_rate = (winning_trades / completed_trades * 100) if completed_trades > 0 else 0.0
 
-        return {
+        self._summary_cache = {
             "total_trades": len(self._trades),
             "completed_trades": completed_trades,
             "total_pnl": total_pnl,
             "win_rate": win_rate,
             "avg_pnl": total_pnl / completed_trades if completed_trades > 0 else 0.0,
         }
+        return self._summary_cache
 
     def generate_daily_summary(self, date: datetime.date = None) -> str:
         """Generate comprehensive daily summary report.
@@ -414,173 +529,173 @@ class PerformanceReporter:
         Returns:
             Formatted summary report
         """
+        now = datetime.now()
         if date is None:
-            date = datetime.now().date()
-
-        # Filter trades for the day
-        day_trades = [t for t in self._trades
-                     if t["timestamp"].date() == date]
-
-        # Filter signals for the day
-        day_signals = [s for s in self._signals_generated
-                      if s["timestamp"].date() == date]
-
-        # Filter regime changes for the day
-        day_regimes = [r for r in self._regime_changes
-                      if r["timestamp"].date() == date]
-
-        # Filter errors for the day
-        day_errors = [e for e in self._errors
-                     if e["timestamp"].date() == date]
-
-        # Build report
-        lines = []
-        lines.append("=" * 80)
-        lines.append(f"AUTOTRADE - DAILY TRADING SUMMARY")
-        lines.append(f"Date: {date.strftime('%A, %B %d, %Y')}")
-        lines.append("=" * 80)
-        lines.append("")
+            date = now.date()
+
+        # Slicing isoformat() output beats strftime for plain HH:MM:SS; this
+        # is the hot formatting path when a day has many rows.
+        def _hms(ts: datetime) -> str:
+            return ts.isoformat(timespec="seconds")[11:19]
+
+        # Records are appended chronologically, so the day's window can be
+        # located by bisecting the parallel timestamp lists instead of
+        # comparing .date() on every record ever collected.
+        day_start = datetime.combine(date, time.min)
+        day_end = day_start + timedelta(days=1)
+
+        def _day_slice(records: list, stamps: list[datetime]) -> list:
+            lo = bisect_left(stamps, day_start)
+            hi = bisect_left(stamps, day_end, lo)
+            return records[lo:hi]
+
+        day_trades = _day_slice(self._trades, self._trade_ts)
+        day_signals = _day_slice(self._signals_generated, self._signal_ts)
+        day_regimes = _day_slice(self._regime_changes, self._regime_ts)
+        day_errors = _day_slice(self._errors, self._error_ts)
+
+        # Build report by writing into one growable buffer; the previous
+        # list-of-lines + join allocated every line twice.
+        buf = io.StringIO()
+        w = buf.write
+        w(_RULE)
+        w(f"AUTOTRADE - DAILY TRADING SUMMARY\n")
+        w(f"Date: {date.strftime('%A, %B %d, %Y')}\n")
+        w(_RULE)
+        w("\n")
 
         # Session info
         if self._session_start:
-            lines.append("SESSION INFO")
-            lines.append("-" * 80)
-            lines.append(f"Session started: {self._session_start.strftime('%H:%M:%S')}")
-            lines.append(f"Report generated: {datetime.now().strftime('%H:%M:%S')}")
-            lines.append("")
+            w("SESSION INFO\n")
+            w(_SUB)
+            w(f"Session started: {_hms(self._session_start)}\n")
+            w(f"Report generated: {_hms(now)}\n")
+            w("\n")
 
         # Market regime changes
-        lines.append("MARKET REGIME CHANGES")
-        lines.append("-" * 80)
+        w("MARKET REGIME CHANGES\n")
+        w(_SUB)
         if day_regimes:
             for regime in day_regimes:
-                time_str = regime["timestamp"].strftime('%H:%M:%S')
+                time_str = _hms(regime["timestamp"])
                 strategies = ", ".join(regime["active_strategies"]) if regime["active_strategies"] else "None (cash preservation)"
-                lines.append(f"[{time_str}] {regime['regime']}")
-                lines.append(f"           Active strategies: {strategies}")
+                w(f"[{time_str}] {regime['regime']}\n")
+                w(f"           Active strategies: {strategies}\n")
         else:
-            lines.append("No regime changes recorded")
-        lines.append("")
+            w("No regime changes recorded\n")
+        w("\n")
 
         # Trading activity
-        lines.append("TRADING ACTIVITY")
-        lines.append("-" * 80)
+        w("TRADING ACTIVITY\n")
+        w(_SUB)
 
         if day_trades:
-            # Group by ticker
-            by_ticker = {}
-            for trade in day_trades:
-                ticker = trade["ticker"]
-                if ticker not in by_ticker:
-                    by_ticker[ticker] = []
-                by_ticker[ticker].append(trade)
+            # Grouping is maintained incrementally by record_trade.
+            by_ticker = self._trades_by_ticker.get(date.toordinal(), {})
 
             for ticker, trades in by_ticker.items():
-                lines.append(f"\n{ticker}:")
+                w(f"\n{ticker}:\n")
                 for trade in trades:
-                    time_str = trade["timestamp"].strftime('%H:%M:%S')
-                    action_str = trade["action"].upper()
-                    qty = trade["quantity"]
-                    price = trade["price"]
-                    strategy = trade["strategy"]
+                    time_str = _hms(trade.timestamp)
+                    action_str = trade.action.upper()
+                    qty = trade.quantity
+                    price = trade.price
+                    strategy = trade.strategy
 
                     line = f"  [{time_str}] {action_str} {qty:,} shares @ ${price:.2f} ({strategy})"
 
-                    if trade["pnl"] is not None:
-                        pnl_sign = "+" if trade["pnl"] >= 0 else ""
-                        line += f" - P&L: {pnl_sign}${trade['pnl']:.2f}"
+                    if trade.pnl is not None:
+                        pnl_sign = "+" if trade.pnl >= 0 else ""
+                        line += f" - P&L: {pnl_sign}${trade.pnl:.2f}"
 
-                    lines.append(line)
+                    w(line)
+                    w("\n")
 
             # Summary stats
-            lines.append("")
-            total_buys = sum(1 for t in day_trades if t["action"] == "buy")
-            total_sells = sum(1 for t in day_trades if t["action"] == "sell")
-            total_pnl = sum(t["pnl"] for t in day_trades if t["pnl"] is not None)
+            w("\n")
+            total_buys = sum(1 for t in day_trades if t.action == "buy")
+            total_sells = sum(1 for t in day_trades if t.action == "sell")
+            total_pnl = sum(t.pnl for t in day_trades if t.pnl is not None)
 
-            lines.append(f"Total trades: {len(day_trades)} ({total_buys} buys, {total_sells} sells)")
+            w(f"Total trades: {len(day_trades)} ({total_buys} buys, {total_sells} sells)\n")
             if total_pnl != 0:
                 pnl_sign = "+" if total_pnl >= 0 else ""
-                lines.append(f"Total P&L: {pnl_sign}${total_pnl:.2f}")
+                w(f"Total P&L: {pnl_sign}${total_pnl:.2f}\n")
         else:
-            lines.append("No trades executed today")
+            w("No trades executed today\n")
 
-        lines.append("")
+        w("\n")
 
         # Signals generated
-        lines.append("SIGNALS GENERATED")
-        lines.append("-" * 80)
+        w("SIGNALS GENERATED\n")
+        w(_SUB)
 
         if day_signals:
-            executed_signals = [s for s in day_signals if s["executed"]]
-            ignored_signals = [s for s in day_signals if not s["executed"]]
-
-            lines.append(f"Total signals: {len(day_signals)}")
-            lines.append(f"Executed: {len(executed_signals)}")
-            lines.append(f"Ignored: {len(ignored_signals)}")
-            lines.append("")
-
-            # Group by strategy
-            by_strategy = {}
-            for signal in day_signals:
-                strategy = signal["strategy"]
-                if strategy not in by_strategy:
-                    by_strategy[strategy] = []
-                by_strategy[strategy].append(signal)
+            # Count in one pass instead of materializing executed/ignored
+            # sublists that are only ever measured.
+            executed_count = sum(1 for s in day_signals if s.executed)
+
+            w(f"Total signals: {len(day_signals)}\n")
+            w(f"Executed: {executed_count}\n")
+            w(f"Ignored: {len(day_signals) - executed_count}\n")
+            w("\n")
+
+            # Grouping is maintained incrementally by record_signal.
+            by_strategy = self._signals_by_strategy.get(date.toordinal(), {})
 
             for strategy, signals in by_strategy.items():
-                lines.append(f"\n{strategy}:")
+                w(f"\n{strategy}:\n")
                 for signal in signals[:10]:  # Max 10 per strategy
-                    time_str = signal["timestamp"].strftime('%H:%M:%S')
-                    ticker = signal["ticker"]
-                    signal_type = signal["signal_type"].upper()
-                    confidence = signal["confidence"] * 100
-                    executed = "✓ EXECUTED" if signal["executed"] else "✗ Ignored"
-                    lines.append(f"  [{time_str}] {ticker} - {signal_type} (confidence: {confidence:.0f}%) - {executed}")
+                    time_str = _hms(signal.timestamp)
+                    ticker = signal.ticker
+                    signal_type = signal.signal_type.upper()
+                    confidence = signal.confidence * 100
+                    executed = "✓ EXECUTED" if signal.executed else "✗ Ignored"
+                    w(f"  [{time_str}] {ticker} - {signal_type} (confidence: {confidence:.0f}%) - {executed}\n")
         else:
-            lines.append("No signals generated today")
+            w("No signals generated today\n")
 
-        lines.append("")
+        w("\n")
 
         # Performance summary
-        lines.append("PERFORMANCE SUMMARY")
-        lines.append("-" * 80)
+        w("PERFORMANCE SUMMARY\n")
+        w(_SUB)
 
         summary = self.get_summary()
-        lines.append(f"Total trades (all-time): {summary['total_trades']}")
-        lines.append(f"Completed trades: {summary['completed_trades']}")
-        lines.append(f"Win rate: {summary['win_rate']:.1f}%")
+        w(f"Total trades (all-time): {summary['total_trades']}\n")
+        w(f"Completed trades: {summary['completed_trades']}\n")
+        w(f"Win rate: {summary['win_rate']:.1f}%\n")
 
         if summary['total_pnl'] != 0:
             pnl_sign = "+" if summary['total_pnl'] >= 0 else ""
-            lines.append(f"Total P&L (all-time): {pnl_sign}${summary['total_pnl']:.2f}")
-            lines.append(f"Average P&L per trade: {pnl_sign}${summary['avg_pnl']:.2f}")
+            w(f"Total P&L (all-time): {pnl_sign}${summary['total_pnl']:.2f}\n")
+            w(f"Average P&L per trade: {pnl_sign}${summary['avg_pnl']:.2f}\n")
 
-        lines.append("")
+        w("\n")
 
         # Errors
         if day_errors:
-            lines.append("ERRORS")
-            lines.append("-" * 80)
+            w("ERRORS\n")
+            w(_SUB)
             for error in day_errors:
-                time_str = error["timestamp"].strftime('%H:%M:%S')
+                time_str = _hms(error["timestamp"])
                 error_type = error["type"]
                 error_msg = error["error"]
                 context = f" ({error['context']})" if error['context'] else ""
-                lines.append(f"[{time_str}] {error_type}{context}: {error_msg}")
-            lines.append("")
+                w(f"[{time_str}] {error_type}{context}: {error_msg}\n")
+            w("\n")
 
         # Footer
-        lines.append("=" * 80)
-        lines.append("End of Report")
-        lines.append("=" * 80)
+        w(_RULE)
+        w("End of Report\n")
+        w(_RULE)
 
-        report = "\n".join(lines)
+        report = buf.getvalue()
 
         # Save to file
         filename = f"daily_summary_{date.isoformat()}.txt"
         filepath = self._reports_dir / filename
-        filepath.write_text(report, encoding="utf-8")
+        _write_report(filepath, report)
 
         return report
 
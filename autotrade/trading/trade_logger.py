@@ -1,8 +1,9 @@
 """Lightweight CSV trade logger with running daily PnL."""
 from __future__ import annotations
 
-import csv
+import atexit
 from dataclasses import dataclass as _dataclass
+from functools import lru_cache
 from datetime import datetime, date
 from pathlib import Path
 from typing import Any
@@ -34,62 +35,127 @@ class TradeRecord:
     position_avg_cost: float
 
 
+_HEADER = (
+    "timestamp,ticker,side,quantity,price,notional,reason,metadata,"
+    "realized_pnl,cumulative_pnl,position_quantity,position_avg_cost\n"
+)
+
+
+@lru_cache(maxsize=256)
+def _format_metadata_cached(items: tuple) -> str:
+    """Join metadata items, memoized on the (order-preserving) item tuple.
+
+    The same reason/threshold payload recurs for every same-strategy trade
+    in a session, so repeat formats collapse to a cache lookup.
+    """
+    if len(items) == 1:
+        key, value = items[0]
+        return f"{key}={value}"
+    return "; ".join(f"{key}={value}" for key, value in items)
+
+
+def _csv_escape(value: str) -> str:
+    """Quote a field only when it contains CSV-hostile characters.
+
+    The fixed numeric/identifier columns never need quoting; only the
+    free-form reason and metadata fields can carry commas or quotes.
+    """
+    if '"' in value or "," in value or "\n" in value:
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
 class TradeLogger:
-    """Append-only CSV logger that keeps daily realized PnL totals."""
+    """Append-only CSV logger that keeps daily realized PnL totals.
+
+    Records are buffered in memory and written in batches of
+    ``flush_threshold`` rows, and each daily CSV is opened once and kept
+    as a persistent buffered handle, so an active session pays one
+    open/exists check per day instead of per trade. Buffered rows are
+    flushed at interpreter exit; call :meth:`flush` (or :meth:`close`)
+    explicitly at shutdown to persist sooner.
+    """
 
-    def __init__(self, root: str | Path = "data/trades") -> None:
+    def __init__(self, root: str | Path = "data/trades", *, flush_threshold: int = 32) -> None:
         self._root = Path(root)
         self._root.mkdir(parents=True, exist_ok=True)
         self._daily_totals: dict[date, float] = {}
+        self._flush_threshold = max(1, int(flush_threshold))
+        self._buffer: list[tuple[date, str]] = []
+        self._handles: dict[date, Any] = {}
+        atexit.register(self.close)
 
     def record(self, record: TradeRecord) -> None:
         day = record.timestamp.date()
         running = self._daily_totals.get(day, 0.0) + record.realized_pnl
         self._daily_totals[day] = running
         record.cumulative_pnl = running
-        path = self._root / f"{day.isoformat()}.csv"
-        file_exists = path.exists()
-        with path.open("a", newline="") as handle:
-            writer = csv.writer(handle)
-            if not file_exists:
-                writer.writerow(
-                    [
-                        "timestamp",
-                        "ticker",
-                        "side",
-                        "quantity",
-                        "price",
-                        "notional",
-                        "reason",
-                        "metadata",
-                        "realized_pnl",
-                        "cumulative_pnl",
-                        "position_quantity",
-                        "position_avg_cost",
-                    ]
-                )
-            writer.writerow(
-                [
-                    record.timestamp.isoformat(),
-                    record.ticker,
-                    record.side,
-                    record.quantity,
-                    f"{record.price:.4f}",
-                    f"{record.notional:.2f}",
-                    record.reason,
-                    self._format_metadata(record.metadata),
-                    f"{record.realized_pnl:.2f}",
-                    f"{running:.2f}",
-                    f"{record.position_quantity:.4f}",
-                    f"{record.position_avg_cost:.4f}",
-                ]
-            )
+        # The 12-column schema is fixed and mostly numeric, so one f-string
+        # replaces the generic csv.writer quoting walk; only the free-form
+        # fields go through _csv_escape.
+        reason = _csv_escape(record.reason)
+        if record.metadata:
+            try:
+                formatted = _format_metadata_cached(tuple(record.metadata.items()))
+            except TypeError:
+                # Unhashable values cannot key the cache; format directly.
+                formatted = self._format_metadata(record.metadata)
+        else:
+            formatted = ""
+        metadata = _csv_escape(formatted)
+        row = (
+            f"{record.timestamp.isoformat()},{record.ticker},{record.side},"
+            f"{record.quantity},{record.price:.4f},{record.notional:.2f},"
+            f"{reason},{metadata},{record.realized_pnl:.2f},{running:.2f},"
+            f"{record.position_quantity:.4f},{record.position_avg_cost:.4f}\n"
+        )
+        self._buffer.append((day, row))
+        if len(self._buffer) >= self._flush_threshold:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write any buffered records to their daily CSV files."""
+        if not self._buffer:
+            return
+        buffered, self._buffer = self._buffer, []
+        rows_by_day: dict[date, list[str]] = {}
+        for day, row in buffered:
+            rows_by_day.setdefault(day, []).append(row)
+        for day, rows in rows_by_day.items():
+            handle = self._writer_handle(day)
+            handle.write("".join(rows))
+            handle.flush()
+
+    def close(self) -> None:
+        """Flush buffered records and close all daily file handles."""
+        self.flush()
+        handles, self._handles = self._handles, {}
+        for handle in handles.values():
+            handle.close()
+
+    def _writer_handle(self, day: date):
+        """Return the persistent append handle for ``day``, opening it (and
+        writing the header for a new file) on first use."""
+        handle = self._handles.get(day)
+        if handle is None:
+            path = self._root / f"{day.isoformat()}.csv"
+            new_file = not path.exists()
+            handle = path.open("a", buffering=1 << 16, newline="")
+            if new_file:
+                handle.write(_HEADER)
+            self._handles[day] = handle
+        return handle
 
     @staticmethod
     def _format_metadata(metadata: dict[str, Any]) -> str:
         if not metadata:
             return ""
         try:
+            if len(metadata) == 1:
+                # Most trades carry a single reason entry; skip the
+                # generator + join machinery for that case.
+                key, value = next(iter(metadata.items()))
+                return f"{key}={value}"
             return "; ".join(f"{key}={value}" for key, value in metadata.items())
         except (AttributeError, TypeError, ValueError) as exc:
             # Fallback if metadata is malformed or contains non-serializable values
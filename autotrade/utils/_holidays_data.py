@@ -0,0 +1,117 @@
+"""NYSE full-closure holidays, generated by scripts/gen_holidays.py.
+
+Covers 2025-2035. Regenerate (do not hand-edit) when the
+window needs extending or the exchange changes its calendar.
+"""
+
+# Sorted date.toordinal() values; one line per holiday for reviewability.
+HOLIDAY_ORDINAL_TABLE: tuple[int, ...] = (
+    739252,  # 2025-01-01 New Year's Day
+    739271,  # 2025-01-20 MLK Jr. Day
+    739299,  # 2025-02-17 Presidents Day
+    739359,  # 2025-04-18 Good Friday
+    739397,  # 2025-05-26 Memorial Day
+    739421,  # 2025-06-19 Juneteenth
+    739436,  # 2025-07-04 Independence Day
+    739495,  # 2025-09-01 Labor Day
+    739582,  # 2025-11-27 Thanksgiving
+    739610,  # 2025-12-25 Christmas
+    739617,  # 2026-01-01 New Year's Day
+    739635,  # 2026-01-19 MLK Jr. Day
+    739663,  # 2026-02-16 Presidents Day
+    739709,  # 2026-04-03 Good Friday
+    739761,  # 2026-05-25 Memorial Day
+    739786,  # 2026-06-19 Juneteenth
+    739800,  # 2026-07-03 Independence Day (observed)
+    739866,  # 2026-09-07 Labor Day
+    739946,  # 2026-11-26 Thanksgiving
+    739975,  # 2026-12-25 Christmas
+    739982,  # 2027-01-01 New Year's Day
+    739999,  # 2027-01-18 MLK Jr. Day
+    740027,  # 2027-02-15 Presidents Day
+    740066,  # 2027-03-26 Good Friday
+    740132,  # 2027-05-31 Memorial Day
+    740150,  # 2027-06-18 Juneteenth (observed)
+    740167,  # 2027-07-05 Independence Day (observed)
+    740230,  # 2027-09-06 Labor Day
+    740310,  # 2027-11-25 Thanksgiving
+    740339,  # 2027-12-24 Christmas (observed)
+    740363,  # 2028-01-17 MLK Jr. Day
+    740398,  # 2028-02-21 Presidents Day
+    740451,  # 2028-04-14 Good Friday
+    740496,  # 2028-05-29 Memorial Day
+    740517,  # 2028-06-19 Juneteenth
+    740532,  # 2028-07-04 Independence Day
+    740594,  # 2028-09-04 Labor Day
+    740674,  # 2028-11-23 Thanksgiving
+    740706,  # 2028-12-25 Christmas
+    740713,  # 2029-01-01 New Year's Day
+    740727,  # 2029-01-15 MLK Jr. Day
+    740762,  # 2029-02-19 Presidents Day
+    740801,  # 2029-03-30 Good Friday
+    740860,  # 2029-05-28 Memorial Day
+    740882,  # 2029-06-19 Juneteenth
+    740897,  # 2029-07-04 Independence Day
+    740958,  # 2029-09-03 Labor Day
+    741038,  # 2029-11-22 Thanksgiving
+    741071,  # 2029-12-25 Christmas
+    741078,  # 2030-01-01 New Year's Day
+    741098,  # 2030-01-21 MLK Jr. Day
+    741126,  # 2030-02-18 Presidents Day
+    741186,  # 2030-04-19 Good Friday
+    741224,  # 2030-05-27 Memorial Day
+    741247,  # 2030-06-19 Juneteenth
+    741262,  # 2030-07-04 Independence Day
+    741322,  # 2030-09-02 Labor Day
+    741409,  # 2030-11-28 Thanksgiving
+    741436,  # 2030-12-25 Christmas
+    741443,  # 2031-01-01 New Year's Day
+    741462,  # 2031-01-20 MLK Jr. Day
+    741490,  # 2031-02-17 Presidents Day
+    741543,  # 2031-04-11 Good Friday
+    741588,  # 2031-05-26 Memorial Day
+    741612,  # 2031-06-19 Juneteenth
+    741627,  # 2031-07-04 Independence Day
+    741686,  # 2031-09-01 Labor Day
+    741773,  # 2031-11-27 Thanksgiving
+    741801,  # 2031-12-25 Christmas
+    741808,  # 2032-01-01 New Year's Day
+    741826,  # 2032-01-19 MLK Jr. Day
+    741854,  # 2032-02-16 Presidents Day
+    741893,  # 2032-03-26 Good Friday
+    741959,  # 2032-05-31 Memorial Day
+    741977,  # 2032-06-18 Juneteenth (observed)
+    741994,  # 2032-07-05 Independence Day (observed)
+    742057,  # 2032-09-06 Labor Day
+    742137,  # 2032-11-25 Thanksgiving
+    742166,  # 2032-12-24 Christmas (observed)
+    742190,  # 2033-01-17 MLK Jr. Day
+    742225,  # 2033-02-21 Presidents Day
+    742278,  # 2033-04-15 Good Friday
+    742323,  # 2033-05-30 Memorial Day
+    742344,  # 2033-06-20 Juneteenth (observed)
+    742358,  # 2033-07-04 Independence Day
+    742421,  # 2033-09-05 Labor Day
+    742501,  # 2033-11-24 Thanksgiving
+    742533,  # 2033-12-26 Christmas (observed)
+    742540,  # 2034-01-02 New Year's Day (observed)
+    742554,  # 2034-01-16 MLK Jr. Day
+    742589,  # 2034-02-20 Presidents Day
+    742635,  # 2034-04-07 Good Friday
+    742687,  # 2034-05-29 Memorial Day
+    742708,  # 2034-06-19 Juneteenth
+    742723,  # 2034-07-04 Independence Day
+    742785,  # 2034-09-04 Labor Day
+    742865,  # 2034-11-23 Thanksgiving
+    742897,  # 2034-12-25 Christmas
+    742904,  # 2035-01-01 New Year's Day
+    742918,  # 2035-01-15 MLK Jr. Day
+    742953,  # 2035-02-19 Presidents Day
+    742985,  # 2035-03-23 Good Friday
+    743051,  # 2035-05-28 Memorial Day
+    743073,  # 2035-06-19 Juneteenth
+    743088,  # 2035-07-04 Independence Day
+    743149,  # 2035-09-03 Labor Day
+    743229,  # 2035-11-22 Thanksgiving
+    743262,  # 2035-12-25 Christmas
+)
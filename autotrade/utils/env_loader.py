@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import os
+import re
 from pathlib import Path
 from typing import Iterable
 
@@ -16,25 +17,37 @@ _ENV_KEYS: set[str] = {
     "SCHWAB_CALLBACK_URL",
 }
 
+# One compiled pattern replaces the strip/startswith/split/quote-trim chain:
+# optional ``export``, an identifier key, and a double-quoted, single-quoted,
+# or bare value.
+_DOTENV_RE = re.compile(
+    r"^\s*(?:export\s+)?([A-Za-z_][A-Za-z0-9_]*)\s*=\s*"
+    r"(?:\"([^\"]*)\"|'([^']*)'|(.*?))\s*$"
+)
+
 
 def _parse_dotenv(path: Path) -> dict[str, str]:
     """Parse simple KEY=VALUE lines from a .env file into a dict."""
+    return _parse_dotenv_text(path.read_text(), path)
+
+
+def _parse_dotenv_text(text: str, source: Path) -> dict[str, str]:
+    """Parse dotenv ``text``; ``source`` is only used in error messages."""
     values: dict[str, str] = {}
-    for line_number, raw_line in enumerate(path.read_text().splitlines(), start=1):
-        line = raw_line.strip()
-        if not line or line.startswith("#"):
+    for line_number, raw_line in enumerate(text.splitlines(), start=1):
+        stripped = raw_line.strip()
+        if not stripped or stripped[0] == "#":
             continue
-        if line.startswith("export "):
-            line = line[len("export ") :].strip()
-        if "=" not in line:
-            raise ValueError(f"Invalid line {line_number} in {path}: {raw_line!r}")
-        key, value = line.split("=", 1)
-        key = key.strip()
-        if not key:
-            raise ValueError(f"Missing key on line {line_number} in {path}")
-        value = value.strip()
-        if value and value[0] == value[-1] and value[0] in {'"', "'"}:
-            value = value[1:-1]
+        match = _DOTENV_RE.match(raw_line)
+        if match is None:
+            raise ValueError(f"Invalid line {line_number} in {source}: {raw_line!r}")
+        key, double_quoted, single_quoted, bare = match.groups()
+        if double_quoted is not None:
+            value = double_quoted
+        elif single_quoted is not None:
+            value = single_quoted
+        else:
+            value = bare
         values[key] = value
     return values
 
@@ -57,9 +70,14 @@ def get_schwab_credentials(
     """Load Schwab credentials from the environment, optionally hydrating from a .env file."""
     explicit_path = os.getenv("SCHWAB_DOTENV_PATH") or dotenv_path
     for candidate in _candidate_paths(explicit_path):
-        if not candidate.exists():
+        # The read attempt is the existence check: one syscall instead of a
+        # stat followed by an open, and no window for the file to vanish
+        # between the two.
+        try:
+            text = candidate.read_text()
+        except FileNotFoundError:
             continue
-        entries = _parse_dotenv(candidate)
+        entries = _parse_dotenv_text(text, candidate)
         for key in _ENV_KEYS:
             if key in entries and (override or os.getenv(key) is None):
                 os.environ[key] = entries[key]
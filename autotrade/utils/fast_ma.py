@@ -0,0 +1,70 @@
+"""O(N) rolling-window kernels for the analysis code.
+
+A naive rolling mean re-sums every window, costing O(N*W); differencing a
+cumulative sum turns each window into two array reads, so a whole series
+costs O(N) regardless of window size. The rolling max gets the same bound
+from a monotonic deque: every element enters and leaves the deque at most
+once.
+"""
+from __future__ import annotations
+
+from collections import deque
+
+import numpy as np
+
+
+def sma(values: np.ndarray, window: int) -> np.ndarray:
+    """Simple moving average via cumulative-sum differencing.
+
+    Args:
+        values: Input series (any array-like of numbers)
+        window: Window length
+
+    Returns:
+        Array of ``len(values) - window + 1`` window means; empty when the
+        input is shorter than the window.
+    """
+    if window <= 0:
+        raise ValueError("window must be positive")
+    x = np.asarray(values, dtype=np.float64)
+    if x.size < window:
+        return np.empty(0, dtype=np.float64)
+    sums = np.cumsum(x)
+    out = np.empty(x.size - window + 1, dtype=np.float64)
+    out[0] = sums[window - 1]
+    out[1:] = sums[window:] - sums[:-window]
+    out /= window
+    return out
+
+
+def rolling_max(values: np.ndarray, window: int) -> np.ndarray:
+    """Rolling window maximum via a monotonic index deque.
+
+    Each bar does O(1) amortized work: indices of candidates are kept in
+    decreasing-value order, dominated candidates are popped as new bars
+    arrive, and the front expires as it leaves the window.
+
+    Args:
+        values: Input series (any array-like of numbers)
+        window: Window length
+
+    Returns:
+        Array of ``len(values) - window + 1`` window maxima; empty when
+        the input is shorter than the window.
+    """
+    if window <= 0:
+        raise ValueError("window must be positive")
+    x = np.asarray(values, dtype=np.float64)
+    if x.size < window:
+        return np.empty(0, dtype=np.float64)
+    out = np.empty(x.size - window + 1, dtype=np.float64)
+    candidates: deque[int] = deque()
+    for i in range(x.size):
+        while candidates and x[candidates[-1]] <= x[i]:
+            candidates.pop()
+        candidates.append(i)
+        if candidates[0] <= i - window:
+            candidates.popleft()
+        if i >= window - 1:
+            out[i - window + 1] = x[candidates[0]]
+    return out
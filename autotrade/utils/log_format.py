@@ -0,0 +1,29 @@
+"""Logging helpers shared by the command-line entry points."""
+from __future__ import annotations
+
+import logging
+import time
+
+
+class CachedFormatter(logging.Formatter):
+    """Formatter that caches the second-precision asctime prefix.
+
+    The stock Formatter runs time.localtime + time.strftime for every
+    record; a bot emitting several log lines per tick regenerates the same
+    second-granularity prefix over and over. This variant reformats only
+    when the floor second changes and appends the per-record milliseconds.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._last_second = -1
+        self._last_asctime = ""
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        if second != self._last_second:
+            self._last_second = second
+            self._last_asctime = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+        return f"{self._last_asctime},{int(record.msecs):03d}"
@@ -1,9 +1,12 @@
 """Market hours validation utilities for US stock markets."""
 from __future__ import annotations
 
-from datetime import datetime, time
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, time, timedelta
 from zoneinfo import ZoneInfo
 
+from autotrade.utils._holidays_data import HOLIDAY_ORDINAL_TABLE
+
 # US stock market timezone
 US_EASTERN = ZoneInfo("America/New_York")
 
@@ -17,18 +20,108 @@ PREMARKET_OPEN_TIME = time(4, 0)
 # After-hours trading (4:00 PM - 8:00 PM ET)
 AFTERHOURS_CLOSE_TIME = time(20, 0)
 
-# Market holidays (2026) - update annually
-MARKET_HOLIDAYS_2026 = {
-    "2026-01-01",  # New Year's Day
-    "2026-01-19",  # MLK Jr. Day
-    "2026-02-16",  # Presidents Day
-    "2026-04-03",  # Good Friday
-    "2026-05-25",  # Memorial Day
-    "2026-07-03",  # Independence Day (observed)
-    "2026-09-07",  # Labor Day
-    "2026-11-26",  # Thanksgiving
-    "2026-12-25",  # Christmas
-}
+# Seconds-of-day equivalents of the boundaries above; the per-tick hour
+# checks compare plain ints instead of dispatching time.time rich compares.
+_MARKET_OPEN_S = MARKET_OPEN_TIME.hour * 3600 + MARKET_OPEN_TIME.minute * 60
+_MARKET_CLOSE_S = MARKET_CLOSE_TIME.hour * 3600 + MARKET_CLOSE_TIME.minute * 60
+_PREMARKET_OPEN_S = PREMARKET_OPEN_TIME.hour * 3600 + PREMARKET_OPEN_TIME.minute * 60
+_AFTERHOURS_CLOSE_S = AFTERHOURS_CLOSE_TIME.hour * 3600 + AFTERHOURS_CLOSE_TIME.minute * 60
+
+# Market holidays come from the generated multi-year table (the previous
+# hand-maintained single-year set silently matched nothing after Dec 31);
+# run scripts/gen_holidays.py to extend the window.
+# Ordinal-int views: hashing an int is cheaper than hashing a date, and the
+# sorted tuple feeds the vectorized batch check.
+_HOLIDAY_ORDINALS_SORTED: tuple[int, ...] = HOLIDAY_ORDINAL_TABLE
+
+# Bit i set means weekday i (Mon=0) trades; a shift+and replaces the < 5
+# comparison and ports directly to the vectorized path.
+_BDAY_MASK = 0b0011111
+HOLIDAY_ORDINALS: frozenset[int] = frozenset(HOLIDAY_ORDINAL_TABLE)
+HOLIDAY_DATES: frozenset[date] = frozenset(
+    date.fromordinal(ordinal) for ordinal in HOLIDAY_ORDINAL_TABLE
+)
+
+
+def _to_eastern(dt: datetime | None) -> datetime:
+    """Normalize ``dt`` to an aware US Eastern datetime (defaulting to now).
+
+    Every public predicate used to repeat this prologue, and the composed
+    checks then re-ran it on already-normalized datetimes; funneling through
+    one helper keeps each public entry point to a single tz conversion.
+    """
+    if dt is None:
+        return datetime.now(US_EASTERN)
+    if dt.tzinfo is None:
+        # Treat naive datetimes as US Eastern
+        return dt.replace(tzinfo=US_EASTERN)
+    return dt.astimezone(US_EASTERN)
+
+
+def _is_trading_day(day: date) -> bool:
+    """True when ``day`` is a weekday that is not a market holiday."""
+    return (_BDAY_MASK >> day.weekday()) & 1 and day.toordinal() not in HOLIDAY_ORDINALS
+
+
+def _seconds_of_day(dt: datetime) -> int:
+    return dt.hour * 3600 + dt.minute * 60 + dt.second
+
+
+def _is_regular_hours(dt: datetime) -> bool:
+    """Regular-hours check for an already-Eastern datetime."""
+    if not _is_trading_day(dt.date()):
+        return False
+    return _MARKET_OPEN_S <= _seconds_of_day(dt) < _MARKET_CLOSE_S
+
+
+def _is_extended_hours(dt: datetime) -> bool:
+    """Extended-hours check for an already-Eastern datetime."""
+    if not _is_trading_day(dt.date()):
+        return False
+    seconds = _seconds_of_day(dt)
+
+    # Pre-market hours
+    if _PREMARKET_OPEN_S <= seconds < _MARKET_OPEN_S:
+        return True
+
+    # After-hours
+    if _MARKET_CLOSE_S <= seconds < _AFTERHOURS_CLOSE_S:
+        return True
+
+    return False
+
+
+def regular_market_hours_mask(day_ordinals, seconds_of_day):
+    """Vectorized regular-hours test for backtest/replay sweeps.
+
+    Calling :func:`is_regular_market_hours` per historical bar is dominated
+    by Python-level branching; this evaluates whole arrays at once.
+
+    Args:
+        day_ordinals: Integer array of ``date.toordinal()`` values
+        seconds_of_day: Integer array of seconds since midnight ET
+
+    Returns:
+        Boolean numpy array, True where the bar falls in regular hours
+    """
+    # Deferred import keeps the per-tick live-trading path stdlib-only.
+    import numpy as np
+
+    day_ordinals = np.asarray(day_ordinals, dtype=np.int64)
+    seconds_of_day = np.asarray(seconds_of_day, dtype=np.int64)
+    weekday = (day_ordinals - 1) % 7  # ordinal 1 (0001-01-01) was a Monday
+    mask = (
+        ((_BDAY_MASK >> weekday) & 1).astype(bool)
+        & (seconds_of_day >= _MARKET_OPEN_S)
+        & (seconds_of_day < _MARKET_CLOSE_S)
+    )
+    # searchsorted into the ~100-element sorted table beats np.isin, which
+    # would sort or hash the full input per call.
+    table = np.asarray(_HOLIDAY_ORDINALS_SORTED, dtype=np.int64)
+    idx = np.searchsorted(table, day_ordinals)
+    holiday = (idx < table.size) & (table[np.minimum(idx, table.size - 1)] == day_ordinals)
+    mask &= ~holiday
+    return mask
 
 
 def is_market_holiday(dt: datetime | None = None) -> bool:
@@ -40,17 +133,7 @@ def is_market_holiday(dt: datetime | None = None) -> bool:
     Returns:
         True if the date is a market holiday
     """
-    if dt is None:
-        dt = datetime.now(US_EASTERN)
-    elif dt.tzinfo is None:
-        # Convert naive datetime to US Eastern
-        dt = dt.replace(tzinfo=US_EASTERN)
-    else:
-        # Convert to US Eastern
-        dt = dt.astimezone(US_EASTERN)
-
-    date_str = dt.strftime("%Y-%m-%d")
-    return date_str in MARKET_HOLIDAYS_2026
+    return _to_eastern(dt).toordinal() in HOLIDAY_ORDINALS
 
 
 def is_weekend(dt: datetime | None = None) -> bool:
@@ -62,14 +145,7 @@ def is_weekend(dt: datetime | None = None) -> bool:
     Returns:
         True if the date is a weekend
     """
-    if dt is None:
-        dt = datetime.now(US_EASTERN)
-    elif dt.tzinfo is None:
-        dt = dt.replace(tzinfo=US_EASTERN)
-    else:
-        dt = dt.astimezone(US_EASTERN)
-
-    return dt.weekday() >= 5  # 5=Saturday, 6=Sunday
+    return _to_eastern(dt).weekday() >= 5  # 5=Saturday, 6=Sunday
 
 
 def is_regular_market_hours(dt: datetime | None = None) -> bool:
@@ -81,18 +157,7 @@ def is_regular_market_hours(dt: datetime | None = None) -> bool:
     Returns:
         True if within regular market hours
     """
-    if dt is None:
-        dt = datetime.now(US_EASTERN)
-    elif dt.tzinfo is None:
-        dt = dt.replace(tzinfo=US_EASTERN)
-    else:
-        dt = dt.astimezone(US_EASTERN)
-
-    if is_weekend(dt) or is_market_holiday(dt):
-        return False
-
-    current_time = dt.time()
-    return MARKET_OPEN_TIME <= current_time < MARKET_CLOSE_TIME
+    return _is_regular_hours(_to_eastern(dt))
 
 
 def is_extended_hours(dt: datetime | None = None) -> bool:
@@ -107,27 +172,7 @@ def is_extended_hours(dt: datetime | None = None) -> bool:
     Returns:
         True if within extended trading hours
     """
-    if dt is None:
-        dt = datetime.now(US_EASTERN)
-    elif dt.tzinfo is None:
-        dt = dt.replace(tzinfo=US_EASTERN)
-    else:
-        dt = dt.astimezone(US_EASTERN)
-
-    if is_weekend(dt) or is_market_holiday(dt):
-        return False
-
-    current_time = dt.time()
-
-    # Pre-market hours
-    if PREMARKET_OPEN_TIME <= current_time < MARKET_OPEN_TIME:
-        return True
-
-    # After-hours
-    if MARKET_CLOSE_TIME <= current_time < AFTERHOURS_CLOSE_TIME:
-        return True
-
-    return False
+    return _is_extended_hours(_to_eastern(dt))
 
 
 def is_market_open(dt: datetime | None = None, *, allow_extended_hours: bool = False) -> bool:
@@ -140,84 +185,117 @@ def is_market_open(dt: datetime | None = None, *, allow_extended_hours: bool = F
     Returns:
         True if the market is open for trading
     """
-    if is_regular_market_hours(dt):
-        return True
-
-    if allow_extended_hours and is_extended_hours(dt):
+    eastern = _to_eastern(dt)
+    # One trading-day check covers both the regular and extended windows;
+    # composing the public predicates would repeat it.
+    if not _is_trading_day(eastern.date()):
+        return False
+    seconds = _seconds_of_day(eastern)
+    if _MARKET_OPEN_S <= seconds < _MARKET_CLOSE_S:
         return True
-
-    return False
+    return allow_extended_hours and (
+        _PREMARKET_OPEN_S <= seconds < _MARKET_OPEN_S
+        or _MARKET_CLOSE_S <= seconds < _AFTERHOURS_CLOSE_S
+    )
 
 
-def next_market_open() -> datetime:
+def next_market_open(now: datetime | None = None) -> datetime:
     """Calculate the next market open time.
 
+    Args:
+        now: Reference time (defaults to now in US Eastern time)
+
     Returns:
         Datetime of the next market open (9:30 AM ET)
     """
-    now = datetime.now(US_EASTERN)
-    current_date = now.date()
-    current_time = now.time()
-
-    # If before market open today and not weekend/holiday, return today
-    if current_time < MARKET_OPEN_TIME and not is_weekend(now) and not is_market_holiday(now):
-        return datetime.combine(current_date, MARKET_OPEN_TIME, tzinfo=US_EASTERN)
-
-    # Otherwise find next business day
-    from datetime import timedelta
-
-    next_day = now + timedelta(days=1)
-    for _ in range(10):  # Check up to 10 days ahead
-        next_day_dt = datetime.combine(next_day.date(), MARKET_OPEN_TIME, tzinfo=US_EASTERN)
-        if not is_weekend(next_day_dt) and not is_market_holiday(next_day_dt):
-            return next_day_dt
-        next_day += timedelta(days=1)
-
-    # Fallback: return tomorrow at market open
-    return datetime.combine(
-        (now + timedelta(days=1)).date(),
-        MARKET_OPEN_TIME,
-        tzinfo=US_EASTERN,
-    )
-
-
-def time_until_market_open() -> float:
+    now = _to_eastern(now)
+    day = now.date()
+
+    # If before market open today and today trades, the answer is today.
+    # Direct construction skips datetime.combine's component re-extraction.
+    if _seconds_of_day(now) < _MARKET_OPEN_S and _is_trading_day(day):
+        return datetime(day.year, day.month, day.day,
+                        MARKET_OPEN_TIME.hour, MARKET_OPEN_TIME.minute,
+                        tzinfo=US_EASTERN)
+
+    # Weekends are deterministic, so jump straight to the next weekday and
+    # only loop over consecutive holidays instead of probing day by day.
+    day += timedelta(days=1)
+    while True:
+        if day.weekday() >= 5:
+            day += timedelta(days=7 - day.weekday())
+        if day.toordinal() not in HOLIDAY_ORDINALS:
+            return datetime(day.year, day.month, day.day,
+                            MARKET_OPEN_TIME.hour, MARKET_OPEN_TIME.minute,
+                            tzinfo=US_EASTERN)
+        day += timedelta(days=1)
+
+
+def time_until_market_open(now: datetime | None = None, *, next_open: datetime | None = None) -> float:
     """Calculate seconds until the next market open.
 
+    Args:
+        now: Reference time (defaults to now in US Eastern time)
+        next_open: Pre-computed next_market_open(now), if the caller has it
+
     Returns:
         Number of seconds until market opens (0 if already open)
     """
-    if is_market_open():
+    now = _to_eastern(now)
+    if _is_regular_hours(now):
         return 0.0
 
-    now = datetime.now(US_EASTERN)
-    next_open = next_market_open()
-    delta = next_open - now
-    return delta.total_seconds()
+    if next_open is None:
+        next_open = next_market_open(now)
+    # Epoch subtraction avoids allocating an intermediate timedelta.
+    return next_open.timestamp() - now.timestamp()
+
+
+@dataclass(slots=True, frozen=True)
+class MarketStatus:
+    """Point-in-time market status snapshot.
+
+    A slotted frozen dataclass instead of the old dict return: field access
+    is an offset load rather than a hash lookup, and each poll allocates one
+    object instead of a dict plus eight entries.
+    """
 
+    is_open: bool
+    is_regular_hours: bool
+    is_extended_hours: bool
+    is_weekend: bool
+    is_holiday: bool
+    next_open: datetime
+    seconds_until_open: float
+    current_time_et: datetime
 
-def get_market_status() -> dict[str, any]:
+    def as_dict(self) -> dict:
+        """Dict view for callers that still want key-based access."""
+        return asdict(self)
+
+
+def get_market_status() -> MarketStatus:
     """Get comprehensive market status information.
 
     Returns:
-        Dict with market status details:
-        - is_open: bool, whether market is currently open
-        - is_regular_hours: bool, whether it's regular trading hours
-        - is_extended_hours: bool, whether it's extended hours
-        - is_weekend: bool, whether it's a weekend
-        - is_holiday: bool, whether it's a market holiday
-        - next_open: datetime, next market open time
-        - seconds_until_open: float, seconds until next open
+        MarketStatus snapshot (open/regular/extended flags, weekend and
+        holiday flags, next open time and seconds until it)
     """
+    # Compute the clock reading and each predicate exactly once; the
+    # individual helpers would otherwise redo the tz conversion and the
+    # weekend/holiday checks several times over.
     now = datetime.now(US_EASTERN)
-
-    return {
-        "is_open": is_market_open(now),
-        "is_regular_hours": is_regular_market_hours(now),
-        "is_extended_hours": is_extended_hours(now),
-        "is_weekend": is_weekend(now),
-        "is_holiday": is_market_holiday(now),
-        "next_open": next_market_open(),
-        "seconds_until_open": time_until_market_open(),
-        "current_time_et": now,
-    }
+    day = now.date()
+    regular = _is_regular_hours(now)
+    next_open = next_market_open(now)
+
+    return MarketStatus(
+        is_open=regular,
+        is_regular_hours=regular,
+        is_extended_hours=_is_extended_hours(now),
+        is_weekend=day.weekday() >= 5,
+        is_holiday=day.toordinal() in HOLIDAY_ORDINALS,
+        next_open=next_open,
+        seconds_until_open=0.0 if regular else next_open.timestamp() - now.timestamp(),
+        current_time_et=now,
+    )
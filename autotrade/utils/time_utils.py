@@ -1,6 +1,7 @@
 """Timezone-aware datetime utilities for consistent time handling."""
 from __future__ import annotations
 
+import time
 from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
 
@@ -27,6 +28,33 @@ def now_eastern() -> datetime:
     return datetime.now(US_EASTERN)
 
 
+# (monotonic instant, cached Eastern datetime) for now_eastern_cached.
+_NOW_EASTERN_CACHE: list = [0.0, None]
+
+
+def now_eastern_cached(max_age: float = 0.5) -> datetime:
+    """Get a recent US Eastern time, reusing the last reading if fresh enough.
+
+    Each datetime.now(US_EASTERN) call bisects the tz transition table;
+    callers that only need second-level precision (market-hours gating in a
+    polling loop) can share one reading per interval. Anything stamping
+    orders or records should keep calling :func:`now_eastern`.
+
+    Args:
+        max_age: Maximum staleness in seconds before a fresh reading is taken
+
+    Returns:
+        Timezone-aware datetime in US Eastern time, at most ``max_age`` old
+    """
+    instant = time.monotonic()
+    if _NOW_EASTERN_CACHE[1] is not None and instant - _NOW_EASTERN_CACHE[0] < max_age:
+        return _NOW_EASTERN_CACHE[1]
+    now = datetime.now(US_EASTERN)
+    _NOW_EASTERN_CACHE[0] = instant
+    _NOW_EASTERN_CACHE[1] = now
+    return now
+
+
 def to_utc(dt: datetime) -> datetime:
     """Convert datetime to UTC.
 
@@ -83,6 +111,10 @@ def format_timestamp(dt: datetime, *, include_tz: bool = True) -> str:
         Formatted timestamp string
     """
     dt = ensure_timezone(dt)
+    # isoformat with a space separator renders the same "%Y-%m-%d %H:%M:%S"
+    # shape in C, without strftime's per-call format parsing; the tz name is
+    # appended from tzname() to keep the %Z-style suffix.
+    stamp = dt.isoformat(sep=" ", timespec="seconds")
     if include_tz:
-        return dt.strftime("%Y-%m-%d %H:%M:%S %Z")
-    return dt.strftime("%Y-%m-%d %H:%M:%S")
+        return f"{stamp[:19]} {dt.tzname() or ''}".rstrip()
+    return stamp[:19]
@@ -4,10 +4,7 @@ from __future__ import annotations
 import argparse
 import logging
 
-from autotrade.broker import SchwabClient
-from autotrade.config import BotConfig
-from autotrade.utils.env_loader import get_schwab_credentials
-from autotrade.trading.loop import run_trading_loop
+from autotrade.utils.log_format import CachedFormatter
 
 
 def parse_args() -> argparse.Namespace:
@@ -24,15 +21,33 @@ def parse_args() -> argparse.Namespace:
 
 
 def configure_logging(level: str) -> None:
+    log_format = "%(asctime)s [%(levelname)s] %(name)s - %(message)s"
+    # force=True drops handlers left over from a previous configure_logging
+    # call, which otherwise double every log line (and its formatting cost)
+    # when main() is invoked repeatedly in one process.
     logging.basicConfig(
-        level=getattr(logging, level.upper(), logging.INFO),
-        format="%(asctime)s [%(levelname)s] %(name)s - %(message)s",
+        level=logging.getLevelNamesMapping().get(level.upper(), logging.INFO),
+        format=log_format,
+        force=True,
     )
+    # Swap in the caching formatter so per-record asctime rendering does not
+    # redo strftime for every line emitted within the same second.
+    formatter = CachedFormatter(log_format)
+    for handler in logging.getLogger().handlers:
+        handler.setFormatter(formatter)
 
 
 def main() -> None:
     args = parse_args()
     configure_logging(args.log_level)
+
+    # Deferred until after argument parsing: the broker client drags in the
+    # HTTP/OAuth stack, which --help and bad-flag invocations never need.
+    from autotrade.broker import SchwabClient
+    from autotrade.config import BotConfig
+    from autotrade.trading.loop import run_trading_loop
+    from autotrade.utils.env_loader import get_schwab_credentials
+
     config = BotConfig.default(strategy=args.strategy)
     credentials = get_schwab_credentials()
     mode = "paper" if args.dry_run else "live"
@@ -14,20 +14,37 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import atexit
+import heapq
+import json
 import logging
+import operator
+import os
+import queue
 import sys
+import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, time as dt_time
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 # Add autotrade to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from autotrade.analysis.market_regime import MarketRegimeDetector
+from autotrade.analysis.market_regime import (
+    MarketRegime,
+    MarketRegimeDetector,
+    TrendDirection,
+    TrendStrength,
+    VolatilityRegime,
+)
 from autotrade.broker.schwab_client import SchwabClient
 from autotrade.config import BotConfig, MeanReversionParams, MomentumBreakoutParams
+from autotrade.data.market import MarketData
 from autotrade.scanner.stock_screener import StockScreener, ScreenerCriteria
 from autotrade.scanner.watchlist import WatchlistManager
 from autotrade.strategy.mean_reversion import MeanReversionStrategy
@@ -37,10 +54,154 @@ from autotrade.strategy.strategy_manager import StrategyManager
 from autotrade.trading.circuit_breaker import CircuitBreaker
 from autotrade.trading.execution import TradeExecutor
 from autotrade.trading.reporting import PerformanceReporter
-from autotrade.utils.market_hours import is_market_open, get_market_status
+from autotrade.utils.log_format import CachedFormatter
+from autotrade.utils.market_hours import is_market_open, get_market_status, next_market_open
 
 _LOG = logging.getLogger(__name__)
 
+# On-disk price-data cache. Intraday polls re-download the same history even
+# though only the last bar changes, so cached frames short-circuit the network
+# round trip: 5 minutes for the days=1 monitoring fetch, 4 hours for the long
+# history used by scanning and regime detection.
+_CACHE_DIR = Path("data/cache")
+_CACHE_TTL_SHORT = 300.0
+_CACHE_TTL_LONG = 14400.0
+
+_REGIME_CACHE_PATH = Path("data/regime_cache.json")
+_STATE_PATH = Path("reports/bot_state.json")
+
+# Early-drop gates applied before signal generation: tickers this illiquid
+# or this quiet never produce an executable setup, so there is no point
+# paying for indicator computation on them.
+_MIN_AVG_DAILY_VOLUME = 500_000
+_MIN_DAILY_VOLATILITY = 0.002
+
+# yfinance is imported once on first use instead of inside every fetch
+# call (which would re-run the sys.modules lookup and import-lock dance
+# per ticker), while CLI invocations that never fetch skip the import cost.
+_yf = None
+
+
+def _yfinance():
+    """Return the yfinance module, importing it on first call."""
+    global _yf
+    if _yf is None:
+        import yfinance
+
+        _yf = yfinance
+    return _yf
+
+
+_conf_key = operator.attrgetter("confidence")
+
+# Tickers per multi-ticker download request; keeps response payloads and
+# retry cost bounded while still amortizing the round trip.
+_BATCH_CHUNK_SIZE = 32
+
+
+def _chunked(items: list[str], size: int):
+    """Yield ``items`` in fixed-size runs (itertools.batched needs 3.12)."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+# Cadences for the deadline scheduler (seconds).
+_REGIME_INTERVAL = 3600.0
+_SCREENER_INTERVAL = 1800.0
+_REPORT_CHECK_INTERVAL = 300.0
+# A cached regime stays valid while SPY's close moves less than this fraction.
+_REGIME_CLOSE_TOLERANCE = 0.005
+_REGIME_MAX_AGE_SECONDS = 3600.0
+
+
+def _cache_ttl(days: int) -> float:
+    """Cache lifetime in seconds for a history window of ``days``."""
+    return _CACHE_TTL_LONG if days >= 50 else _CACHE_TTL_SHORT
+
+
+class PositionBook:
+    """Open positions stored column-wise (struct of arrays).
+
+    Each field is a parallel list indexed by row, with a ticker-to-row map
+    for O(1) membership. Closing a position swaps the last row into the gap,
+    so the columns stay dense and convert straight into numpy arrays for
+    vectorized P&L and holding-period math.
+    """
+
+    __slots__ = (
+        "tickers",
+        "strategy",
+        "entry_price",
+        "entry_date",
+        "quantity",
+        "direction",
+        "_row",
+    )
+
+    def __init__(self) -> None:
+        self.tickers: list[str] = []
+        self.strategy: list[str] = []
+        self.entry_price: list[float] = []
+        self.entry_date: list[datetime] = []
+        self.quantity: list[int] = []
+        self.direction: list[str] = []
+        self._row: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.tickers)
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker in self._row
+
+    def __iter__(self):
+        return iter(self.tickers)
+
+    def row(self, ticker: str) -> int:
+        """Row index of an open position."""
+        return self._row[ticker]
+
+    def open(
+        self,
+        ticker: str,
+        *,
+        strategy: str,
+        entry_price: float,
+        entry_date: datetime,
+        quantity: int,
+        direction: str,
+    ) -> None:
+        """Append a new position as the last row."""
+        self._row[ticker] = len(self.tickers)
+        self.tickers.append(ticker)
+        self.strategy.append(strategy)
+        self.entry_price.append(entry_price)
+        self.entry_date.append(entry_date)
+        self.quantity.append(quantity)
+        self.direction.append(direction)
+
+    def close(self, ticker: str) -> None:
+        """Remove a position, keeping the columns dense (swap-with-last)."""
+        row = self._row.pop(ticker)
+        last = len(self.tickers) - 1
+        for column in (
+            self.tickers,
+            self.strategy,
+            self.entry_price,
+            self.entry_date,
+            self.quantity,
+            self.direction,
+        ):
+            column[row] = column[last]
+            column.pop()
+        if row != last:
+            self._row[self.tickers[row]] = row
+
+    def days_held(self, now: datetime) -> np.ndarray:
+        """Calendar days held per open position, as one vectorized subtract."""
+        if not self.tickers:
+            return np.empty(0, dtype=np.int64)
+        entry = np.array(self.entry_date, dtype="datetime64[s]").astype("datetime64[D]")
+        return (np.datetime64(now, "D") - entry).astype(np.int64)
+
 
 class MultiStrategyBot:
     """Multi-strategy trading bot with continuous operation."""
@@ -83,7 +244,10 @@ class MultiStrategyBot:
         self._last_regime_check = None
         self._last_scan_time = None
         self._last_report_date = None
-        self._positions: dict[str, dict] = {}  # ticker -> position info
+        self._positions = PositionBook()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._regime_cache: dict | None = self._load_regime_cache()
 
         # Initialize strategies
         self._initialize_strategies()
@@ -91,6 +255,10 @@ class MultiStrategyBot:
         # Initialize watchlists
         self._initialize_watchlists()
 
+        # Restore scheduler stamps and open positions from a prior run so a
+        # mid-day restart does not redo an hour of work or orphan positions
+        self._load_state()
+
         _LOG.info("Multi-strategy bot initialized (dry_run=%s)", dry_run)
 
     def _initialize_strategies(self) -> None:
@@ -129,77 +297,128 @@ class MultiStrategyBot:
         _LOG.info("Initialized watchlists")
 
     def run(self) -> None:
-        """Run the main trading loop."""
+        """Run the main trading loop.
+
+        A small deadline scheduler replaces fixed-cadence polling: each task
+        (trading cycle, regime refresh, screener, end-of-day report) carries
+        its own next-due timestamp in a heap and the loop sleeps exactly
+        until the earliest one. While the market is closed, the market-hours
+        tasks suspend until the next session open instead of waking every
+        five minutes.
+        """
         _LOG.info("Starting multi-strategy trading bot...")
         _LOG.info("Market hours: %s - %s", self.config.trading_window.market_open, self.config.trading_window.market_close)
 
+        now = time.time()
+        tasks: list[tuple[float, str]] = [
+            (now, "regime"),
+            (now, "screener"),
+            (now, "cycle"),
+            (now, "report"),
+        ]
+        heapq.heapify(tasks)
+
         try:
             while True:
-                # Check if market is open
-                if not is_market_open():
-                    status = get_market_status()
-                    _LOG.info("Market closed - %s. Sleeping...", status)
-                    time.sleep(300)  # Check every 5 minutes
-                    continue
-
-                # Market is open - run trading cycle
-                try:
-                    self._trading_cycle()
-                except Exception as e:
-                    _LOG.error("Error in trading cycle: %s", e, exc_info=True)
-                    self.reporter.record_error(e, context="trading_cycle")
-
-                # Sleep before next cycle
-                time.sleep(self.config.polling_interval_seconds)
+                due_ts, action = heapq.heappop(tasks)
+                wait = due_ts - time.time()
+                if wait > 0:
+                    time.sleep(wait)
+                heapq.heappush(tasks, (self._run_task(action), action))
 
         except KeyboardInterrupt:
             _LOG.info("Shutting down bot...")
             self._shutdown()
 
-    def _trading_cycle(self) -> None:
-        """Execute one trading cycle."""
-        now = datetime.now()
-
-        # Check if we should generate end-of-day report
-        if self._should_generate_daily_report():
-            self._generate_daily_report()
-            self._last_report_date = now.date()
+    def _run_task(self, action: str) -> float:
+        """Run one scheduled task and return the timestamp it is next due."""
+        now = time.time()
+
+        if action == "report":
+            # Runs regardless of market state: the summary is produced after
+            # the close.
+            if self._should_generate_daily_report():
+                self._generate_daily_report()
+                self._last_report_date = datetime.now().date()
+                self._save_state()
+            return now + _REPORT_CHECK_INTERVAL
+
+        if not is_market_open():
+            next_open = next_market_open()
+            if action == "cycle":
+                status = get_market_status()
+                _LOG.info("Market closed - %s. Sleeping until %s", status, next_open)
+            return next_open.timestamp()
 
-        # 1. Update market regime (every hour)
-        if self._should_update_regime():
-            self._update_market_regime()
+        try:
+            if action == "regime":
+                self._update_market_regime()
+                return now + _REGIME_INTERVAL
+            if action == "screener":
+                self._run_screener()
+                return now + _SCREENER_INTERVAL
+            self._trading_cycle()
+        except Exception as e:
+            _LOG.error("Error in %s task: %s", action, e, exc_info=True)
+            self.reporter.record_error(e, context=action)
+        return now + self.config.polling_interval_seconds
 
-        # 2. Run screener (every 30 minutes)
-        if self._should_run_screener():
-            self._run_screener()
+    def _trading_cycle(self) -> None:
+        """Execute one trading cycle.
 
-        # 3. Get combined watchlist
-        watchlist_tickers = self.watchlist_manager.get_combined_tickers()
+        Regime refresh, screener runs, and the end-of-day report are
+        scheduled independently by :meth:`run`; the cycle only does the
+        per-poll work.
+        """
+        # 1. Get combined watchlist in a stable order so fetch batches,
+        # cache access and log output are reproducible between cycles
+        watchlist_tickers = sorted(self.watchlist_manager.get_combined_tickers())
         _LOG.info("Monitoring %d tickers from watchlists", len(watchlist_tickers))
 
-        # 4. Monitor positions and check exits
-        self._monitor_positions()
-
-        # 5. Scan for entry signals
-        self._scan_for_entries(watchlist_tickers)
+        # Prefetch history for the whole cycle in one batched download;
+        # per-ticker fetches inside the monitor/scan loops would pay one
+        # network round trip per symbol.
+        price_data = self._fetch_price_data_batch(
+            set(watchlist_tickers) | set(self._positions),
+            days=250,
+        )
 
-        # 6. Log status
-        self._log_status()
+        # 2. Monitor positions and check exits
+        self._monitor_positions(price_data)
 
-    def _should_update_regime(self) -> bool:
-        """Check if we should update market regime."""
-        if self._last_regime_check is None:
-            return True
+        # 3. Scan for entry signals (survivors of the cheap gates only)
+        scan_tickers = self._early_drop(watchlist_tickers, price_data)
+        self._scan_for_entries(scan_tickers, price_data)
 
-        # Update every hour
-        elapsed = (datetime.now() - self._last_regime_check).total_seconds()
-        return elapsed >= 3600
+        # 4. Log status
+        self._log_status()
 
     def _update_market_regime(self) -> None:
-        """Update market regime and activate compatible strategies."""
-        _LOG.info("Updating market regime...")
+        """Update market regime and activate compatible strategies.
 
+        SPY's 200-day structure only moves meaningfully on new daily bars, so
+        a cached detection is reused while today's close stays within
+        tolerance of the close it was computed from. Only the cheap one-day
+        quote is fetched to validate the cache; the full 250-day download and
+        regime computation run on cache misses.
+        """
         try:
+            day_data = self._fetch_price_data("SPY", days=1)
+            last_close = None
+            if day_data is not None and len(day_data) > 0:
+                last_close = float(day_data["close"].iloc[-1])
+
+            if last_close is not None and self._cached_regime_fresh(last_close):
+                cached_regime = self._regime_cache["regime"]
+                if self.strategy_manager.current_regime is None:
+                    # Cold restart: re-apply the persisted regime
+                    self.strategy_manager.update_regime(cached_regime)
+                self._last_regime_check = datetime.now()
+                _LOG.info("Market regime unchanged (cached): %s", cached_regime)
+                return
+
+            _LOG.info("Updating market regime...")
+
             # Fetch SPY data for regime detection
             spy_data = self._fetch_price_data("SPY", days=250)
             if spy_data is None or len(spy_data) < 200:
@@ -216,6 +435,14 @@ class MultiStrategyBot:
             self.strategy_manager.update_regime(regime)
 
             self._last_regime_check = datetime.now()
+            self._regime_cache = {
+                "trading_day": datetime.now().date(),
+                "last_close": last_close if last_close is not None else float(spy_data["close"].iloc[-1]),
+                "detected_at": datetime.now(),
+                "regime": regime,
+            }
+            self._save_regime_cache()
+            self._save_state()
 
             # Log active strategies
             active = self.strategy_manager.get_active_strategies()
@@ -227,14 +454,67 @@ class MultiStrategyBot:
         except Exception as e:
             _LOG.error("Error updating market regime: %s", e)
 
-    def _should_run_screener(self) -> bool:
-        """Check if we should run stock screener."""
-        if self._last_scan_time is None:
-            return True
+    def _cached_regime_fresh(self, last_close: float) -> bool:
+        """Check whether the cached regime detection still applies."""
+        cache = self._regime_cache
+        if cache is None:
+            return False
+        now = datetime.now()
+        if cache["trading_day"] != now.date():
+            return False
+        if (now - cache["detected_at"]).total_seconds() >= _REGIME_MAX_AGE_SECONDS:
+            return False
+        cached_close = cache["last_close"]
+        return abs(last_close - cached_close) / cached_close < _REGIME_CLOSE_TOLERANCE
+
+    def _load_regime_cache(self) -> dict | None:
+        """Restore a persisted regime detection from a previous run."""
+        try:
+            payload = json.loads(_REGIME_CACHE_PATH.read_text())
+            regime = MarketRegime(
+                trend_direction=TrendDirection(payload["trend_direction"]),
+                trend_strength=TrendStrength(payload["trend_strength"]),
+                volatility=VolatilityRegime(payload["volatility"]),
+                sma_50=payload["sma_50"],
+                sma_200=payload["sma_200"],
+                atr=payload["atr"],
+                adx=payload["adx"],
+                vix=payload.get("vix"),
+            )
+            return {
+                "trading_day": datetime.fromisoformat(payload["trading_day"]).date(),
+                "last_close": payload["last_close"],
+                "detected_at": datetime.fromisoformat(payload["detected_at"]),
+                "regime": regime,
+            }
+        except FileNotFoundError:
+            return None
+        except (KeyError, ValueError) as e:
+            _LOG.warning("Ignoring invalid regime cache: %s", e)
+            return None
 
-        # Run every 30 minutes
-        elapsed = (datetime.now() - self._last_scan_time).total_seconds()
-        return elapsed >= 1800
+    def _save_regime_cache(self) -> None:
+        """Persist the current regime detection for the next restart."""
+        cache = self._regime_cache
+        regime = cache["regime"]
+        payload = {
+            "trading_day": cache["trading_day"].isoformat(),
+            "last_close": cache["last_close"],
+            "detected_at": cache["detected_at"].isoformat(),
+            "trend_direction": regime.trend_direction.value,
+            "trend_strength": regime.trend_strength.value,
+            "volatility": regime.volatility.value,
+            "sma_50": regime.sma_50,
+            "sma_200": regime.sma_200,
+            "atr": regime.atr,
+            "adx": regime.adx,
+            "vix": regime.vix,
+        }
+        try:
+            _REGIME_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            _REGIME_CACHE_PATH.write_text(json.dumps(payload, indent=2))
+        except OSError as e:
+            _LOG.warning("Could not persist regime cache: %s", e)
 
     def _should_generate_daily_report(self) -> bool:
         """Check if we should generate the daily report.
@@ -282,179 +562,361 @@ class MultiStrategyBot:
                 _LOG.info("Updated screener watchlist with %d tickers", len(top_momentum))
 
             self._last_scan_time = datetime.now()
+            self._save_state()
 
         except Exception as e:
             _LOG.error("Error running screener: %s", e)
 
-    def _monitor_positions(self) -> None:
-        """Monitor existing positions and check exit conditions."""
+    def _monitor_positions(self, price_data: dict[str, pd.DataFrame] | None = None) -> None:
+        """Monitor existing positions and check exit conditions.
+
+        Args:
+            price_data: Pre-fetched per-ticker history from
+                :meth:`_fetch_price_data_batch`; tickers missing from it fall
+                back to a single-ticker fetch.
+        """
         if not self._positions:
             return
 
         _LOG.debug("Monitoring %d positions", len(self._positions))
 
-        for ticker, position in list(self._positions.items()):
-            try:
-                # Fetch current price
-                current_data = self._fetch_price_data(ticker, days=1)
-                if current_data is None or len(current_data) == 0:
-                    continue
+        # Positions missing from the batch are pure I/O wait; fetch them
+        # concurrently instead of one round trip at a time.
+        missing = [
+            ticker
+            for ticker in self._positions
+            if price_data is None or ticker not in price_data
+        ]
+        fetched = self._fetch_concurrently(missing, days=1)
+
+        # Phase 1: snapshot current prices so the exit rules can run as one
+        # batched call instead of per-position round trips into the manager.
+        book = self._positions
+        days_held = book.days_held(datetime.now())
+        snapshot: list[dict] = []
+        for row, ticker in enumerate(book.tickers):
+            current_data = price_data.get(ticker) if price_data else None
+            if current_data is None:
+                current_data = fetched.get(ticker)
+            if current_data is None or len(current_data) == 0:
+                continue
 
-                current_price = current_data["close"].iloc[-1]
+            snapshot.append(
+                {
+                    "ticker": ticker,
+                    "strategy_name": book.strategy[row],
+                    "entry_price": book.entry_price[row],
+                    "current_price": current_data["close"].iloc[-1],
+                    "direction": book.direction[row],
+                    "days_held": int(days_held[row]),
+                }
+            )
 
-                # Calculate days held
-                entry_date = position["entry_date"]
-                days_held = (datetime.now() - entry_date).days
+        if not snapshot:
+            return
 
-                # Check exit conditions
-                should_exit, exit_reason = self.strategy_manager.check_exit_conditions(
-                    ticker=ticker,
-                    strategy_name=position["strategy"],
-                    entry_price=position["entry_price"],
-                    current_price=current_price,
-                    direction=position["direction"],
-                    days_held=days_held,
-                )
+        # Phase 2: evaluate every exit in one call, then execute the hits
+        outcomes = self.strategy_manager.check_exit_conditions_batch(snapshot)
 
-                if should_exit:
-                    _LOG.info(
-                        "%s: Exit signal (%s) - Price=%.2f, Entry=%.2f, Days=%d",
-                        ticker,
-                        exit_reason,
-                        current_price,
-                        position["entry_price"],
-                        days_held,
-                    )
+        for payload, (should_exit, exit_reason) in zip(snapshot, outcomes):
+            if not should_exit:
+                continue
 
-                    # Execute exit
-                    quantity = position["quantity"]
-                    action = "sell" if position["direction"] == "long" else "buy"
+            ticker = payload["ticker"]
+            current_price = payload["current_price"]
+            entry_price = payload["entry_price"]
+            direction = payload["direction"]
 
-                    # Calculate P&L
-                    if position["direction"] == "long":
-                        pnl = (current_price - position["entry_price"]) * quantity
-                    else:
-                        pnl = (position["entry_price"] - current_price) * quantity
+            try:
+                _LOG.info(
+                    "%s: Exit signal (%s) - Price=%.2f, Entry=%.2f, Days=%d",
+                    ticker,
+                    exit_reason,
+                    current_price,
+                    entry_price,
+                    payload["days_held"],
+                )
 
-                    if self.executor.execute_trade(
+                # Execute exit
+                quantity = book.quantity[book.row(ticker)]
+                action = "sell" if direction == "long" else "buy"
+
+                # Calculate P&L
+                if direction == "long":
+                    pnl = (current_price - entry_price) * quantity
+                else:
+                    pnl = (entry_price - current_price) * quantity
+
+                if self.executor.execute_trade(
+                    ticker=ticker,
+                    action=action,
+                    quantity=quantity,
+                    price=current_price,
+                ):
+                    # Record exit trade with P&L
+                    self.reporter.record_trade(
                         ticker=ticker,
                         action=action,
                         quantity=quantity,
                         price=current_price,
-                    ):
-                        # Record exit trade with P&L
-                        self.reporter.record_trade(
-                            ticker=ticker,
-                            action=action,
-                            quantity=quantity,
-                            price=current_price,
-                            strategy=position["strategy"],
-                            pnl=pnl,
-                        )
+                        strategy=payload["strategy_name"],
+                        pnl=pnl,
+                    )
 
-                        # Remove from positions
-                        del self._positions[ticker]
-                        _LOG.info("%s: Position closed - P&L: %+.2f", ticker, pnl)
+                    # Remove from positions
+                    book.close(ticker)
+                    self._save_state()
+                    _LOG.info("%s: Position closed - P&L: %+.2f", ticker, pnl)
 
             except Exception as e:
-                _LOG.error("Error monitoring position for %s: %s", ticker, e)
+                _LOG.error("Error closing position for %s: %s", ticker, e)
+
+    def _early_drop(self, tickers: list[str], price_data: dict[str, pd.DataFrame]) -> list[str]:
+        """Filter the watchlist down to tickers worth running strategies on.
 
-    def _scan_for_entries(self, tickers: set[str]) -> None:
-        """Scan for entry signals across watchlist."""
+        Most watchlist tickers fail at least one cheap gate — not enough
+        history, too thin to trade, or flat enough that no setup can form —
+        so dropping them here avoids MarketData construction and indicator
+        computation for the bulk of the universe. The gates run as
+        column-wise pandas reductions, not a per-ticker Python loop.
+
+        Tickers absent from ``price_data`` pass through untouched so the
+        per-ticker fetch fallback in the scan still applies to them.
+
+        Args:
+            tickers: Watchlist tickers
+            price_data: Pre-fetched per-ticker history
+
+        Returns:
+            Sorted list of tickers that survive every gate
+        """
+        if not self.strategy_manager.get_active_strategies():
+            return []
+
+        unfetched = [t for t in tickers if t not in price_data]
+        candidates = [
+            t for t in tickers if t in price_data and len(price_data[t]) >= 50
+        ]
+        if not candidates:
+            return sorted(unfetched)
+
+        volumes = pd.DataFrame(
+            {t: price_data[t]["volume"].tail(20).to_numpy() for t in candidates}
+        )
+        closes = pd.DataFrame(
+            {t: price_data[t]["close"].tail(21).to_numpy() for t in candidates}
+        )
+        liquid = volumes.mean() > _MIN_AVG_DAILY_VOLUME
+        moving = closes.pct_change().std() > _MIN_DAILY_VOLATILITY
+        keep = liquid & moving
+
+        survivors = sorted([t for t in candidates if keep[t]] + unfetched)
+        _LOG.debug(
+            "Early drop: %d of %d tickers survive", len(survivors), len(tickers)
+        )
+        return survivors
+
+    def _scan_for_entries(self, tickers: list[str], price_data: dict[str, pd.DataFrame] | None = None) -> None:
+        """Scan for entry signals across watchlist.
+
+        Args:
+            tickers: Watchlist tickers to evaluate
+            price_data: Pre-fetched per-ticker history from
+                :meth:`_fetch_price_data_batch`; tickers missing from it fall
+                back to a single-ticker fetch.
+        """
+        # Nothing active means nothing can signal; skip the batch outright
+        if not self.strategy_manager.get_active_strategies():
+            return
+
+        # Convert eligible tickers to MarketData up front so signal
+        # generation runs once over the whole batch.
+        eligible: dict[str, MarketData] = {}
         for ticker in tickers:
             # Skip if already have position
             if ticker in self._positions:
                 continue
 
             try:
-                # Fetch price data
-                data = self._fetch_price_data(ticker, days=250)
+                data = price_data.get(ticker) if price_data else None
+                if data is None:
+                    data = self._fetch_price_data(ticker, days=250)
                 if data is None or len(data) < 50:
                     continue
 
-                # Convert to MarketData format
-                from autotrade.data.market import MarketData
+                eligible[ticker] = MarketData.from_dataframe(ticker, data)
+            except Exception as e:
+                _LOG.error("Error preparing data for %s: %s", ticker, e)
 
-                market_data = MarketData(
-                    ticker=ticker,
-                    date=data.index.tolist(),
-                    open_price=data["open"].tolist(),
-                    high_price=data["high"].tolist(),
-                    low_price=data["low"].tolist(),
-                    close_price=data["close"].tolist(),
-                    volume=data["volume"].tolist(),
-                )
+        if not eligible:
+            return
+
+        # Generate signals from all active strategies in one batched call
+        signals_by_ticker = self.strategy_manager.generate_signals_batch(eligible)
+
+        for ticker, signals in signals_by_ticker.items():
+            if not signals:
+                continue
+
+            try:
+                # Only the strongest signal matters; max() is a single O(k)
+                # pass with no lambda frame per comparison
+                best_signal = max(signals, key=_conf_key)
 
-                # Generate signals from all active strategies
-                signals = self.strategy_manager.generate_signals(ticker, market_data)
+                strategy_name = best_signal.metadata.get("strategy", "unknown")
 
-                # Execute strongest signal
-                if signals:
-                    # Sort by confidence
-                    signals.sort(key=lambda s: s.confidence, reverse=True)
-                    best_signal = signals[0]
+                _LOG.debug(
+                    "%s: Signal from %s (confidence=%.2f)",
+                    ticker,
+                    strategy_name,
+                    best_signal.confidence,
+                )
 
-                    strategy_name = best_signal.metadata.get("strategy", "unknown")
+                # Calculate position size (simplified - 2% risk)
+                # TODO: Use proper position sizing based on ATR
+                position_value = self.config.strategy.max_position_size
+                quantity = int(position_value / best_signal.price)
 
-                    _LOG.info(
-                        "%s: Signal from %s (confidence=%.2f)",
-                        ticker,
-                        strategy_name,
-                        best_signal.confidence,
+                if quantity > 0:
+                    # Execute trade
+                    action = "buy" if best_signal.direction == "long" else "sell"
+                    executed = self.executor.execute_trade(
+                        ticker=ticker,
+                        action=action,
+                        quantity=quantity,
+                        price=best_signal.price,
                     )
 
-                    # Calculate position size (simplified - 2% risk)
-                    # TODO: Use proper position sizing based on ATR
-                    position_value = self.config.strategy.max_position_size
-                    quantity = int(position_value / best_signal.price)
+                    # Record signal
+                    self.reporter.record_signal(
+                        ticker=ticker,
+                        signal_type="entry",
+                        strategy=strategy_name,
+                        confidence=best_signal.confidence,
+                        executed=executed,
+                    )
 
-                    if quantity > 0:
-                        # Execute trade
-                        action = "buy" if best_signal.direction == "long" else "sell"
-                        executed = self.executor.execute_trade(
-                            ticker=ticker,
-                            action=action,
+                    if executed:
+                        # Track position
+                        self._positions.open(
+                            ticker,
+                            strategy=strategy_name,
+                            entry_price=best_signal.price,
+                            entry_date=datetime.now(),
                             quantity=quantity,
-                            price=best_signal.price,
+                            direction=best_signal.direction,
+                        )
+                        self._save_state()
+                        _LOG.info(
+                            "%s: Position opened (%d shares @ %.2f)",
+                            ticker,
+                            quantity,
+                            best_signal.price,
                         )
 
-                        # Record signal
-                        self.reporter.record_signal(
+                        # Record trade
+                        self.reporter.record_trade(
                             ticker=ticker,
-                            signal_type="entry",
+                            action=action,
+                            quantity=quantity,
+                            price=best_signal.price,
                             strategy=strategy_name,
-                            confidence=best_signal.confidence,
-                            executed=executed,
+                            pnl=None,  # Entry trade, no P&L yet
                         )
 
-                        if executed:
-                            # Track position
-                            self._positions[ticker] = {
-                                "strategy": strategy_name,
-                                "entry_price": best_signal.price,
-                                "entry_date": datetime.now(),
-                                "quantity": quantity,
-                                "direction": best_signal.direction,
-                            }
-                            _LOG.info(
-                                "%s: Position opened (%d shares @ %.2f)",
-                                ticker,
-                                quantity,
-                                best_signal.price,
-                            )
-
-                            # Record trade
-                            self.reporter.record_trade(
-                                ticker=ticker,
-                                action=action,
-                                quantity=quantity,
-                                price=best_signal.price,
-                                strategy=strategy_name,
-                                pnl=None,  # Entry trade, no P&L yet
-                            )
-
             except Exception as e:
-                _LOG.error("Error scanning %s: %s", ticker, e)
+                _LOG.error("Error executing signal for %s: %s", ticker, e)
+
+        signal_count = sum(1 for signals in signals_by_ticker.values() if signals)
+        _LOG.info(
+            "Scan complete: %d tickers evaluated, %d with signals",
+            len(eligible),
+            signal_count,
+        )
+
+    def _fetch_concurrently(self, tickers: list[str], days: int = 1) -> dict[str, pd.DataFrame]:
+        """Overlap per-ticker fetches in a thread pool.
+
+        One ticker failing is logged and skipped rather than poisoning the
+        rest of the batch, matching the concurrent quote path in
+        :class:`autotrade.data.market.MarketDataService`.
+        """
+        frames: dict[str, pd.DataFrame] = {}
+        if not tickers:
+            return frames
+        with ThreadPoolExecutor(max_workers=min(len(tickers), 8)) as pool:
+            futures = {
+                ticker: pool.submit(self._fetch_price_data, ticker, days)
+                for ticker in tickers
+            }
+            for ticker, future in futures.items():
+                try:
+                    frame = future.result()
+                except Exception as exc:
+                    _LOG.warning("Failed to fetch data for %s: %s", ticker, exc)
+                    continue
+                if frame is not None:
+                    frames[ticker] = frame
+        return frames
+
+    def _fetch_price_data_batch(self, tickers: set[str] | list[str], days: int = 250) -> dict[str, pd.DataFrame]:
+        """
+        Fetch historical price data for many tickers in one download.
+
+        yfinance batches a space-separated ticker list into a single request
+        and returns a column-MultiIndex frame, so N watchlist symbols cost
+        one network round trip instead of N.
+
+        Args:
+            tickers: Tickers to fetch
+            days: Number of days of history
+
+        Returns:
+            Dict of ticker -> OHLCV DataFrame (failed tickers are absent)
+        """
+        tickers = sorted(set(tickers))
+        if not tickers:
+            return {}
+        if len(tickers) == 1:
+            frame = self._fetch_price_data(tickers[0], days=days)
+            return {tickers[0]: frame} if frame is not None else {}
+
+        result: dict[str, pd.DataFrame] = {}
+        for chunk in _chunked(tickers, _BATCH_CHUNK_SIZE):
+            result.update(self._download_batch(chunk, days))
+        return result
+
+    def _download_batch(self, tickers: list[str], days: int) -> dict[str, pd.DataFrame]:
+        """Download one chunk of tickers as a single multi-ticker request."""
+        try:
+            yf = _yfinance()
+
+            data = yf.download(
+                tickers=" ".join(tickers),
+                period=f"{days}d",
+                group_by="ticker",
+                threads=True,
+                progress=False,
+            )
+        except Exception as e:
+            _LOG.warning("Error fetching batched data for %d tickers: %s", len(tickers), e)
+            return {}
+
+        if data is None or len(data) == 0:
+            return {}
+
+        result: dict[str, pd.DataFrame] = {}
+        for ticker in tickers:
+            try:
+                frame = data[ticker].dropna(how="all")
+            except KeyError:
+                continue
+            if len(frame) == 0:
+                continue
+            frame = frame.copy()
+            frame.rename(columns=str.lower, inplace=True)
+            result[ticker] = frame
+        return result
 
     def _fetch_price_data(self, ticker: str, days: int = 250) -> pd.DataFrame | None:
         """
@@ -467,8 +929,12 @@ class MultiStrategyBot:
         Returns:
             DataFrame with OHLCV data
         """
+        cached = self._read_cached(ticker, days)
+        if cached is not None:
+            return cached
+
         try:
-            import yfinance as yf
+            yf = _yfinance()
 
             # Fetch data
             data = yf.download(ticker, period=f"{days}d", progress=False)
@@ -477,14 +943,117 @@ class MultiStrategyBot:
                 return None
 
             # Rename columns to lowercase
-            data.columns = [c.lower() for c in data.columns]
+            data.rename(columns=str.lower, inplace=True)
 
+            self._write_cached(ticker, days, data)
             return data
 
         except Exception as e:
             _LOG.warning("Error fetching data for %s: %s", ticker, e)
             return None
 
+    def _read_cached(self, ticker: str, days: int) -> pd.DataFrame | None:
+        """Return the cached frame for ``(ticker, days)`` if fresh enough."""
+        path = _CACHE_DIR / f"{ticker}_{days}.parquet"
+        try:
+            if time.time() - path.stat().st_mtime < _cache_ttl(days):
+                data = pd.read_parquet(path, engine="pyarrow")
+                self._cache_hits += 1
+                return data
+        except OSError:
+            pass
+        except Exception as e:
+            _LOG.warning("Unreadable price cache for %s: %s", ticker, e)
+        self._cache_misses += 1
+        return None
+
+    def _write_cached(self, ticker: str, days: int, data: pd.DataFrame) -> None:
+        """Store a downloaded frame for later cycles; failures are non-fatal."""
+        try:
+            _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            data.to_parquet(_CACHE_DIR / f"{ticker}_{days}.parquet", compression="zstd")
+        except Exception as e:
+            _LOG.warning("Could not cache price data for %s: %s", ticker, e)
+
+    def _save_state(self) -> None:
+        """Persist scheduler stamps and open positions for the next restart.
+
+        The write goes through a temp file plus os.replace so readers never
+        observe a half-written state file.
+        """
+        book = self._positions
+        payload = {
+            "last_regime_check": (
+                self._last_regime_check.isoformat() if self._last_regime_check else None
+            ),
+            "last_scan_time": (
+                self._last_scan_time.isoformat() if self._last_scan_time else None
+            ),
+            "last_report_date": (
+                self._last_report_date.isoformat() if self._last_report_date else None
+            ),
+            "positions": [
+                {
+                    "ticker": ticker,
+                    "strategy": book.strategy[row],
+                    "entry_price": book.entry_price[row],
+                    "entry_date": book.entry_date[row].isoformat(),
+                    "quantity": book.quantity[row],
+                    "direction": book.direction[row],
+                }
+                for row, ticker in enumerate(book.tickers)
+            ],
+        }
+        try:
+            _STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=str(_STATE_PATH.parent), prefix="bot_state.", suffix=".tmp"
+            )
+            with os.fdopen(fd, "w") as handle:
+                json.dump(payload, handle, indent=2)
+            os.replace(tmp_path, _STATE_PATH)
+        except OSError as e:
+            _LOG.warning("Could not persist bot state: %s", e)
+
+    def _load_state(self) -> None:
+        """Restore persisted state; stale stamps are dropped, not trusted."""
+        try:
+            payload = json.loads(_STATE_PATH.read_text())
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            _LOG.warning("Ignoring invalid bot state: %s", e)
+            return
+
+        try:
+            now = datetime.now()
+            stamp = payload.get("last_regime_check")
+            if stamp:
+                checked = datetime.fromisoformat(stamp)
+                # A regime older than a trading day must be redetected
+                if (now - checked).total_seconds() < 86400:
+                    self._last_regime_check = checked
+            stamp = payload.get("last_scan_time")
+            if stamp:
+                self._last_scan_time = datetime.fromisoformat(stamp)
+            stamp = payload.get("last_report_date")
+            if stamp:
+                self._last_report_date = datetime.fromisoformat(stamp).date()
+
+            for position in payload.get("positions", []):
+                self._positions.open(
+                    position["ticker"],
+                    strategy=position["strategy"],
+                    entry_price=position["entry_price"],
+                    entry_date=datetime.fromisoformat(position["entry_date"]),
+                    quantity=position["quantity"],
+                    direction=position["direction"],
+                )
+            if len(self._positions):
+                _LOG.info("Restored %d open positions from state", len(self._positions))
+        except (KeyError, TypeError, ValueError) as e:
+            _LOG.warning("Could not restore bot state: %s", e)
+
     def _log_status(self) -> None:
         """Log current bot status."""
         regime = self.strategy_manager.current_regime
@@ -492,10 +1061,12 @@ class MultiStrategyBot:
         position_count = len(self._positions)
 
         _LOG.info(
-            "Status: Regime=%s, Active Strategies=%d, Positions=%d",
+            "Status: Regime=%s, Active Strategies=%d, Positions=%d, Cache hits=%d/%d",
             regime if regime else "Unknown",
             len(active_strategies),
             position_count,
+            self._cache_hits,
+            self._cache_hits + self._cache_misses,
         )
 
     def _generate_daily_report(self) -> None:
@@ -513,43 +1084,55 @@ class MultiStrategyBot:
         """Clean shutdown of bot."""
         _LOG.info("Closing all positions...")
 
-        # Close all positions
-        for ticker in list(self._positions.keys()):
+        # Close all positions; removals are deferred so the book is not
+        # mutated (and no snapshot copied) while iterating it
+        book = self._positions
+        closed: list[str] = []
+        for ticker in book:
             try:
-                position = self._positions[ticker]
+                row = book.row(ticker)
+                entry_price = book.entry_price[row]
+                quantity = book.quantity[row]
+                direction = book.direction[row]
+                strategy = book.strategy[row]
                 current_data = self._fetch_price_data(ticker, days=1)
                 if current_data is not None and len(current_data) > 0:
                     current_price = current_data["close"].iloc[-1]
 
-                    action = "sell" if position["direction"] == "long" else "buy"
+                    action = "sell" if direction == "long" else "buy"
 
                     # Calculate P&L
-                    if position["direction"] == "long":
-                        pnl = (current_price - position["entry_price"]) * position["quantity"]
+                    if direction == "long":
+                        pnl = (current_price - entry_price) * quantity
                     else:
-                        pnl = (position["entry_price"] - current_price) * position["quantity"]
+                        pnl = (entry_price - current_price) * quantity
 
                     if self.executor.execute_trade(
                         ticker=ticker,
                         action=action,
-                        quantity=position["quantity"],
+                        quantity=quantity,
                         price=current_price,
                     ):
                         # Record exit trade
                         self.reporter.record_trade(
                             ticker=ticker,
                             action=action,
-                            quantity=position["quantity"],
+                            quantity=quantity,
                             price=current_price,
-                            strategy=position["strategy"],
+                            strategy=strategy,
                             pnl=pnl,
                         )
 
+                    closed.append(ticker)
                     _LOG.info("%s: Position closed on shutdown - P&L: %+.2f", ticker, pnl)
 
             except Exception as e:
                 _LOG.error("Error closing position for %s: %s", ticker, e)
 
+        for ticker in closed:
+            book.close(ticker)
+        self._save_state()
+
         # Generate final daily report
         self._generate_daily_report()
 
@@ -585,18 +1168,27 @@ def main():
 
     args = parser.parse_args()
 
-    # Setup logging
+    # Create logs directory before the file handler opens its target
+    Path("logs").mkdir(exist_ok=True)
+
+    # Setup logging: hot paths hand records to an in-memory queue and a
+    # background listener does the blocking stream/file writes, so a slow
+    # disk never stalls the trading loop on a log line.
+    log_format = "%(asctime)s [%(levelname)s] %(message)s"
+    formatter = CachedFormatter(log_format)
+    sinks = [logging.StreamHandler(), logging.FileHandler("logs/trading_bot.log")]
+    for sink in sinks:
+        sink.setFormatter(formatter)
+
+    log_queue: queue.Queue = queue.Queue(-1)
     logging.basicConfig(
-        level=getattr(logging, args.log_level),
-        format="%(asctime)s [%(levelname)s] %(message)s",
-        handlers=[
-            logging.StreamHandler(),
-            logging.FileHandler("logs/trading_bot.log"),
-        ],
+        level=logging.getLevelNamesMapping().get(args.log_level, logging.INFO),
+        handlers=[QueueHandler(log_queue)],
+        force=True,
     )
-
-    # Create logs directory
-    Path("logs").mkdir(exist_ok=True)
+    listener = QueueListener(log_queue, *sinks)
+    listener.start()
+    atexit.register(listener.stop)
 
     # Determine if dry run
     dry_run = not args.live
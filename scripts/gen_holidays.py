@@ -0,0 +1,116 @@
+"""Regenerate autotrade/utils/_holidays_data.py from NYSE holiday rules.
+
+The trading bot previously shipped a single hand-maintained year of
+holidays, which silently stopped matching anything once the year rolled
+over. This script derives the full-closure NYSE holidays for a ten-year
+window from the exchange's published observance rules (no third-party
+calendar package needed) and emits them as a sorted ordinal table.
+
+Usage:
+    python scripts/gen_holidays.py
+"""
+from __future__ import annotations
+
+from datetime import date, timedelta
+from pathlib import Path
+
+START_YEAR = 2025
+END_YEAR = 2035
+
+OUTPUT_PATH = Path(__file__).resolve().parents[1] / "autotrade" / "utils" / "_holidays_data.py"
+
+
+def _easter(year: int) -> date:
+    """Gregorian Easter Sunday (Anonymous Gregorian algorithm)."""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    g = (8 * b + 13) // 25
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """The n-th given weekday (0=Monday) of a month."""
+    first = date(year, month, 1)
+    offset = (weekday - first.weekday()) % 7
+    return first + timedelta(days=offset + 7 * (n - 1))
+
+
+def _last_weekday(year: int, month: int, weekday: int) -> date:
+    """The last given weekday (0=Monday) of a month."""
+    if month == 12:
+        nxt = date(year + 1, 1, 1)
+    else:
+        nxt = date(year, month + 1, 1)
+    last = nxt - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _observed(holiday: date) -> date | None:
+    """NYSE weekend observance: Saturday moves to Friday, Sunday to Monday.
+
+    A Saturday holiday whose preceding Friday falls in the prior year is not
+    observed at all (the NYSE does not close on New Year's Eve for it).
+    """
+    if holiday.weekday() == 5:
+        observed = holiday - timedelta(days=1)
+        return observed if observed.year == holiday.year else None
+    if holiday.weekday() == 6:
+        return holiday + timedelta(days=1)
+    return holiday
+
+
+def holidays_for_year(year: int) -> list[tuple[date, str]]:
+    """Full-closure NYSE holidays for one year, weekend-observed."""
+    fixed = [
+        (date(year, 1, 1), "New Year's Day"),
+        (date(year, 6, 19), "Juneteenth"),
+        (date(year, 7, 4), "Independence Day"),
+        (date(year, 12, 25), "Christmas"),
+    ]
+    holidays: list[tuple[date, str]] = []
+    for holiday, name in fixed:
+        observed = _observed(holiday)
+        if observed is not None:
+            suffix = " (observed)" if observed != holiday else ""
+            holidays.append((observed, name + suffix))
+    holidays.append((_nth_weekday(year, 1, 0, 3), "MLK Jr. Day"))
+    holidays.append((_nth_weekday(year, 2, 0, 3), "Presidents Day"))
+    holidays.append((_easter(year) - timedelta(days=2), "Good Friday"))
+    holidays.append((_last_weekday(year, 5, 0), "Memorial Day"))
+    holidays.append((_nth_weekday(year, 9, 0, 1), "Labor Day"))
+    holidays.append((_nth_weekday(year, 11, 3, 4), "Thanksgiving"))
+    return sorted(holidays)
+
+
+def main() -> None:
+    entries: list[tuple[date, str]] = []
+    for year in range(START_YEAR, END_YEAR + 1):
+        entries.extend(holidays_for_year(year))
+    entries.sort()
+
+    lines = [
+        '"""NYSE full-closure holidays, generated by scripts/gen_holidays.py.',
+        "",
+        f"Covers {START_YEAR}-{END_YEAR}. Regenerate (do not hand-edit) when the",
+        "window needs extending or the exchange changes its calendar.",
+        '"""',
+        "",
+        "# Sorted date.toordinal() values; one line per holiday for reviewability.",
+        "HOLIDAY_ORDINAL_TABLE: tuple[int, ...] = (",
+    ]
+    for day, name in entries:
+        lines.append(f"    {day.toordinal()},  # {day.isoformat()} {name}")
+    lines.append(")")
+    lines.append("")
+    OUTPUT_PATH.write_text("\n".join(lines), encoding="utf-8")
+    print(f"Wrote {len(entries)} holidays to {OUTPUT_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,12 +8,16 @@ Access at:
 """
 from __future__ import annotations
 
+import queue
 import sys
 import threading
 import time
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
 import streamlit as st
 
 # Add autotrade to path
@@ -34,16 +38,147 @@ if "bot" not in st.session_state:
     st.session_state.bot = None
     st.session_state.bot_thread = None
     st.session_state.is_running = False
-    st.session_state.logs = []
+    # Bounded: old entries fall off in O(1) instead of the list growing
+    # for as long as the dashboard stays up
+    st.session_state.logs = deque(maxlen=500)
+    # Producers put here; the log panel drains it once per render, so a
+    # burst of messages coalesces into a single display update
+    st.session_state.log_queue = queue.SimpleQueue()
+
+
+def tail_file(path: Path, n: int, block: int = 8192) -> str:
+    """Read the last ``n`` lines of a file without loading the whole file.
+
+    Seeks backwards from the end in fixed-size blocks until enough
+    newlines are buffered, so a multi-megabyte log costs only its tail.
+    """
+    with open(path, "rb") as f:
+        f.seek(0, 2)
+        size = f.tell()
+        buf = b""
+        while size > 0 and buf.count(b"\n") <= n:
+            step = min(block, size)
+            size -= step
+            f.seek(size)
+            buf = f.read(step) + buf
+    return b"\n".join(buf.splitlines()[-n:]).decode(errors="replace")
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _batch_last_prices(tickers: tuple[str, ...]) -> dict[str, float]:
+    """Last closes for several tickers from one batched download.
+
+    yfinance folds the whole list into a single Yahoo query, so the
+    Positions tab pays one round trip however many positions are open;
+    the 30 s TTL covers repeated reruns in between. Tickers with no
+    data are simply absent from the result.
+
+    Returns plain floats rather than the downloaded frame: cache_data
+    pickles and hashes its return value on every lookup, which is cheap
+    for a small dict but dominates the hit path for DataFrames. Helpers
+    that must hand back frames should use st.cache_resource and copy at
+    the call site instead.
+    """
+    if not tickers:
+        return {}
+
+    import yfinance as yf
+
+    data = yf.download(
+        list(tickers),
+        period="1d",
+        progress=False,
+        group_by="ticker",
+        threads=True,
+    )
+    prices: dict[str, float] = {}
+    for ticker in tickers:
+        try:
+            frame = data[ticker] if len(tickers) > 1 else data
+            closes = frame["Close"].dropna()
+        except KeyError:
+            continue
+        if len(closes):
+            prices[ticker] = float(closes.iloc[-1])
+    return prices
+
+
+# How much of a selected daily report is previewed in the Reports tab
+_REPORT_PREVIEW_BYTES = 64 * 1024
+
+# Tail cache for read_incremental: path -> (mtime_ns, read offset, lines)
+_LOG_CACHE: dict[Path, tuple[int, int, deque[str]]] = {}
+
+
+def read_incremental(path: Path, tail: int = 20) -> str:
+    """Return the last ``tail`` lines, re-reading only what changed.
+
+    An unchanged file (same mtime and size as last call) is served from
+    the cache with no I/O at all; a grown file is read from the previous
+    offset so each rerun pays only for the appended bytes. Truncation or
+    rotation falls back to a fresh tail read.
+    """
+    stat = path.stat()
+    cached = _LOG_CACHE.get(path)
+    if cached is not None:
+        mtime_ns, offset, lines = cached
+        if mtime_ns == stat.st_mtime_ns and offset == stat.st_size:
+            return "\n".join(lines)
+        if stat.st_size < offset:
+            cached = None  # Truncated or rotated: start over
+
+    if cached is None:
+        lines = deque(tail_file(path, tail).splitlines(), maxlen=tail)
+        offset = path.stat().st_size
+    else:
+        _, offset, lines = cached
+        with open(path, "rb") as f:
+            f.seek(offset)
+            delta = f.read()
+        offset += len(delta)
+        lines.extend(delta.decode(errors="replace").splitlines())
+
+    _LOG_CACHE[path] = (stat.st_mtime_ns, offset, lines)
+    return "\n".join(lines)
+
+
+@st.cache_data(show_spinner=False)
+def _list_reports(dir_mtime_ns: int) -> list[str]:
+    """Report filenames, newest first, cached per directory mtime.
+
+    The mtime key invalidates the entry exactly when a report is added
+    or removed, so idle reruns skip the glob and its stat-per-file cost.
+    """
+    return sorted(
+        (path.name for path in Path("reports").glob("daily_summary_*.txt")),
+        reverse=True,
+    )
 
 
-def run_bot_background(bot):
-    """Run bot in background thread."""
+def run_bot_background(bot, log_queue):
+    """Run bot in background thread.
+
+    Runs outside Streamlit's ScriptRunContext, so it must not touch
+    st.session_state - such writes raise missing-context warnings and
+    are silently dropped. Failures are reported through the log queue
+    and the main thread detects exit via the thread's liveness.
+    """
     try:
         bot.run()
     except Exception as e:
-        st.session_state.logs.append(f"ERROR: {e}")
-        st.session_state.is_running = False
+        log_queue.put(f"ERROR: {e}")
+
+
+@st.cache_resource(show_spinner=False)
+def _make_bot(strategy: str, capital: float, dry_run: bool) -> MultiStrategyBot:
+    """Construct (or reuse) a bot for the given parameters.
+
+    cache_resource keeps one resident instance per parameter set, so
+    toggling Start/Stop with unchanged settings reuses the bot and its
+    sessions instead of repaying the full initialization each time.
+    """
+    config = BotConfig.default(strategy=strategy, capital=capital)
+    return MultiStrategyBot(config=config, dry_run=dry_run)
 
 
 def start_bot(capital: float, dry_run: bool):
@@ -51,22 +186,20 @@ def start_bot(capital: float, dry_run: bool):
     if st.session_state.is_running:
         return
 
-    # Create configuration
-    config = BotConfig.default(strategy="trend_following", capital=capital)
+    # Create (or reuse) the bot
+    st.session_state.bot = _make_bot("trend_following", capital, dry_run)
+    st.session_state.log_queue.put(f"Bot initialized with ${capital:,.0f} capital")
 
-    # Create bot
-    st.session_state.bot = MultiStrategyBot(config=config, dry_run=dry_run)
-    st.session_state.logs.append(f"Bot initialized with ${capital:,.0f} capital")
-
-    # Start bot in background thread
+    # Start bot in background thread; hand it the queue so it never has
+    # to touch session state to report
     st.session_state.bot_thread = threading.Thread(
         target=run_bot_background,
-        args=(st.session_state.bot,),
+        args=(st.session_state.bot, st.session_state.log_queue),
         daemon=True,
     )
     st.session_state.bot_thread.start()
     st.session_state.is_running = True
-    st.session_state.logs.append("Bot started!")
+    st.session_state.log_queue.put("Bot started!")
 
 
 def stop_bot():
@@ -77,15 +210,18 @@ def stop_bot():
     st.session_state.is_running = False
     if st.session_state.bot:
         st.session_state.bot._shutdown()
-    st.session_state.logs.append("Bot stopped")
+    st.session_state.log_queue.put("Bot stopped")
 
 
 # Main UI
 st.title("🤖 AutoTrade - Multi-Strategy Trading Bot")
 st.markdown("---")
 
-# Sidebar - Controls
-with st.sidebar:
+# Sidebar - Controls. A fragment, so Start/Stop clicks rerun only this
+# panel instead of tearing down and re-running the whole script (and its
+# tab renders); the old explicit st.rerun() calls are gone with it.
+@st.fragment
+def sidebar_controls():
     st.header("Bot Controls")
 
     # Capital input
@@ -105,14 +241,18 @@ with st.sidebar:
     with col1:
         if st.button("▶️ Start", disabled=st.session_state.is_running, use_container_width=True):
             start_bot(capital, dry_run)
-            st.rerun()
 
     with col2:
         if st.button("⏹️ Stop", disabled=not st.session_state.is_running, use_container_width=True):
             stop_bot()
-            st.rerun()
 
-    # Status indicator
+    # Status indicator. The bot thread cannot update session state from
+    # outside the ScriptRunContext, so reconcile here: a dead thread
+    # means the bot exited (or crashed - see the Logs tab).
+    if st.session_state.is_running and st.session_state.bot_thread is not None \
+            and not st.session_state.bot_thread.is_alive():
+        st.session_state.is_running = False
+
     if st.session_state.is_running:
         st.success("🟢 Bot Running")
     else:
@@ -126,6 +266,10 @@ with st.sidebar:
     else:
         st.warning("⚠️ **LIVE TRADING MODE**\n\nReal money at risk!")
 
+
+with st.sidebar:
+    sidebar_controls()
+
 # Main content area
 tab1, tab2, tab3, tab4 = st.tabs(["📊 Dashboard", "📈 Positions", "📜 Logs", "📋 Reports"])
 
@@ -137,9 +281,21 @@ with tab1:
 
     if st.session_state.bot:
         regime = st.session_state.bot.strategy_manager.current_regime
-        active_strategies = st.session_state.bot.strategy_manager.get_active_strategies()
         position_count = len(st.session_state.bot._positions)
 
+        # Signature of the cheap state the tab depends on; while it is
+        # unchanged, reuse the derived strategy list instead of walking
+        # the strategy manager again on every rerun. (The widgets are
+        # still emitted - a Streamlit rerun that skips them would blank
+        # the tab - but identical emissions diff to no-ops client-side.)
+        sig = (str(regime), position_count, st.session_state.is_running)
+        if sig != st.session_state.get("_dash_sig"):
+            st.session_state._dash_sig = sig
+            st.session_state._dash_strategies = tuple(
+                st.session_state.bot.strategy_manager.get_active_strategies()
+            )
+        active_strategies = st.session_state._dash_strategies
+
         with col1:
             st.metric("Market Regime", regime if regime else "Unknown")
 
@@ -174,33 +330,44 @@ with tab1:
 with tab2:
     st.header("Current Positions")
 
-    if st.session_state.bot and st.session_state.bot._positions:
-        positions_data = []
-        for ticker, pos in st.session_state.bot._positions.items():
-            # Try to get current price
-            current_data = st.session_state.bot._fetch_price_data(ticker, days=1)
-            if current_data is not None and len(current_data) > 0:
-                current_price = current_data["close"].iloc[-1]
-                pnl = (current_price - pos["entry_price"]) * pos["quantity"]
-                pnl_pct = ((current_price - pos["entry_price"]) / pos["entry_price"]) * 100
-            else:
-                current_price = pos["entry_price"]
-                pnl = 0
-                pnl_pct = 0
-
-            positions_data.append({
-                "Ticker": ticker,
-                "Strategy": pos["strategy"],
-                "Direction": pos["direction"].upper(),
-                "Quantity": pos["quantity"],
-                "Entry Price": f"${pos['entry_price']:.2f}",
-                "Current Price": f"${current_price:.2f}",
-                "P&L": f"${pnl:.2f}",
-                "P&L %": f"{pnl_pct:+.2f}%",
-                "Days Held": (datetime.now() - pos["entry_date"]).days,
-            })
-
-        st.dataframe(positions_data, use_container_width=True)
+    book = st.session_state.bot._positions if st.session_state.bot else None
+    if book is not None and len(book):
+        # One batched quote request for every open position; the book's
+        # columns go straight into arrays, so P&L is two vectorized ops
+        # instead of per-row Python arithmetic and string formatting
+        prices = _batch_last_prices(tuple(sorted(book.tickers)))
+        entry = np.array(book.entry_price, dtype=np.float64)
+        quantity = np.array(book.quantity, dtype=np.float64)
+        current = np.array(
+            [prices.get(ticker, fallback)
+             for ticker, fallback in zip(book.tickers, book.entry_price)]
+        )
+
+        positions_frame = pd.DataFrame({
+            "Ticker": list(book.tickers),
+            "Strategy": list(book.strategy),
+            "Direction": [direction.upper() for direction in book.direction],
+            "Quantity": list(book.quantity),
+            "Entry Price": entry,
+            "Current Price": current,
+            "P&L": (current - entry) * quantity,
+            "P&L %": (current / entry - 1.0) * 100.0,
+            "Days Held": book.days_held(datetime.now()),
+        })
+
+        # Formatting happens client-side in the virtualized table, so
+        # only visible rows pay for it and the columns stay numeric
+        # (sortable) instead of pre-rendered strings
+        st.dataframe(
+            positions_frame,
+            use_container_width=True,
+            column_config={
+                "Entry Price": st.column_config.NumberColumn(format="$%.2f"),
+                "Current Price": st.column_config.NumberColumn(format="$%.2f"),
+                "P&L": st.column_config.NumberColumn(format="$%+.2f"),
+                "P&L %": st.column_config.NumberColumn(format="%+.2f%%"),
+            },
+        )
 
     else:
         st.info("No open positions")
@@ -208,30 +375,32 @@ with tab2:
 with tab3:
     st.header("Activity Log")
 
-    # Auto-refresh checkbox
+    # Auto-refresh checkbox. The old implementation slept 5 s on the
+    # script thread and reran the whole page; a fragment with run_every
+    # schedules the refresh client-side and reruns only the log panel.
     auto_refresh = st.checkbox("Auto-refresh (every 5 seconds)", value=False)
 
-    if auto_refresh:
-        time.sleep(5)
-        st.rerun()
+    @st.fragment(run_every="5s" if auto_refresh else None)
+    def _render_logs():
+        # Drain pending messages in one go before rendering
+        log_queue = st.session_state.log_queue
+        logs = st.session_state.logs
+        while not log_queue.empty():
+            logs.append(log_queue.get_nowait())
 
-    # Display logs
-    log_container = st.container()
-    with log_container:
         if st.session_state.logs:
-            for log in st.session_state.logs[-50:]:  # Last 50 logs
+            for log in list(st.session_state.logs)[-50:]:  # Last 50 logs
                 st.text(log)
         else:
             st.info("No activity yet")
 
-    # Also show bot's log file if it exists
-    log_file = Path("logs/trading_bot.log")
-    if log_file.exists():
-        st.subheader("Recent Bot Logs")
-        with open(log_file) as f:
-            lines = f.readlines()
-            last_20 = "".join(lines[-20:])
-            st.code(last_20, language="log")
+        # Also show bot's log file if it exists
+        log_file = Path("logs/trading_bot.log")
+        if log_file.exists():
+            st.subheader("Recent Bot Logs")
+            st.code(read_incremental(log_file, 20), language="log")
+
+    _render_logs()
 
 with tab4:
     st.header("Daily Reports")
@@ -239,21 +408,34 @@ with tab4:
     # List available reports
     reports_dir = Path("reports")
     if reports_dir.exists():
-        report_files = sorted(reports_dir.glob("daily_summary_*.txt"), reverse=True)
+        report_names = _list_reports(reports_dir.stat().st_mtime_ns)
 
-        if report_files:
+        if report_names:
             # Show most recent report
             st.subheader("Latest Report")
-            selected_report = st.selectbox(
-                "Select Report",
-                options=report_files,
-                format_func=lambda x: x.name,
-            )
+            selected_name = st.selectbox("Select Report", options=report_names)
+            selected_report = reports_dir / selected_name if selected_name else None
 
             if selected_report:
-                with open(selected_report) as f:
-                    report_content = f.read()
+                # Only a screenful is ever visible; preview the tail and
+                # let the full file go through the download button
+                size = selected_report.stat().st_size
+                if size > _REPORT_PREVIEW_BYTES:
+                    with open(selected_report, "rb") as f:
+                        f.seek(size - _REPORT_PREVIEW_BYTES)
+                        report_content = f.read().decode(errors="replace")
+                    st.caption(
+                        f"Showing last {_REPORT_PREVIEW_BYTES // 1024} KB "
+                        f"of {size / 1024:.0f} KB"
+                    )
+                else:
+                    report_content = selected_report.read_text()
                 st.text_area("Report Content", report_content, height=400)
+                st.download_button(
+                    "Download full report",
+                    data=selected_report.read_bytes(),
+                    file_name=selected_report.name,
+                )
         else:
             st.info("No reports generated yet")
     else:
@@ -261,4 +443,7 @@ with tab4:
 
 # Footer
 st.markdown("---")
-st.caption(f"AutoTrade v1.0 | Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+# The timestamp is quantized to 10-second buckets so back-to-back
+# reruns emit identical HTML and the frontend can skip re-transmitting it.
+_footer_ts = datetime.fromtimestamp(time.time() // 10 * 10)
+st.caption(f"AutoTrade v1.0 | Last updated: {_footer_ts:%Y-%m-%d %H:%M:%S}")